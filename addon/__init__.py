@@ -8,7 +8,9 @@ bl_info = {
     "category": "Development",
 }
 
+import asyncio
 import builtins
+import concurrent.futures
 import errno
 import io
 import json
@@ -17,24 +19,45 @@ import math
 import os
 import queue
 import socket
+import stat
+import subprocess
 import sys
+import tempfile
 import threading
 import time
 import traceback
 import uuid
-from contextlib import redirect_stderr, redirect_stdout
+from collections.abc import Iterator
+from contextlib import redirect_stderr, redirect_stdout, suppress
 from typing import Any
 
 import bpy
 from bpy.app.handlers import persistent
 
+try:
+    import numpy as np
+except ImportError:  # numpy ships with Blender, but keep the add-on importable without it
+    np = None
+
+try:
+    import orjson
+except ImportError:  # Blender's bundled Python does not ship orjson
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Blender's bundled Python does not ship uvloop
+    uvloop = None
+
 from addon.models import (
+    BatchParams,
     ExportFileParams,
     JobIdParams,
     MaterialAssignParams,
     MaterialCreateParams,
     MaterialSetColorParams,
     MaterialSetTextureParams,
+    ObjectBulkTransformParams,
     ObjectCreateMeshParams,
     ObjectDeleteParams,
     ObjectDuplicateParams,
@@ -53,12 +76,32 @@ logger = logging.getLogger(__name__)
 
 HOST = "127.0.0.1"
 PORT = 9876
-BUFFER_SIZE = 65536
+# BLENDER_MCP_TRANSPORT=unix in both Blender's and the MCP server's environment skips the TCP stack.
+# Setting BLENDER_MCP_SOCKET picks the socket path and implies the unix transport.
+TRANSPORT = os.environ.get("BLENDER_MCP_TRANSPORT", "unix" if os.environ.get("BLENDER_MCP_SOCKET") else "tcp").lower()
+SOCKET_PATH = os.environ.get("BLENDER_MCP_SOCKET") or (
+    f"/tmp/blender-mcp-{os.getuid()}.sock" if hasattr(os, "getuid") else ""
+)
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024  # Largest request line accepted from a client
+_NL = b"\n"  # Message delimiter for legacy newline-framed clients
+FRAME_HEADER_SIZE = 4  # Big-endian payload length preceding each length-prefixed frame
+# A connection whose first byte is one of these speaks newline-delimited JSON; anything else
+# is the first byte of a frame header (always <= 0x04 given MAX_MESSAGE_SIZE).
+_LEGACY_FIRST_BYTES = frozenset(b"{[ \t\r\n")
+STREAM_MIN_ITEMS = 1000  # Result lists at least this long are encoded piece by piece for legacy newline clients
+STREAM_CHUNK_ITEMS = 256  # List items encoded per streamed write
+SOCKET_BUFFER_SIZE = 1024 * 1024  # Kernel send/receive buffer requested per client connection
+MAX_CLIENTS = 8  # Further connections are refused until a slot frees up
+MAX_REQUESTS_PER_TICK = 64  # Bounds how long one timer tick can block Blender's UI
+MAX_PIPELINED_REQUESTS = 64  # Requests read ahead of their replies per connection before reading pauses
+_DEG2RAD = math.pi / 180.0  # Degrees-to-radians factor for Euler rotation params
 
 # Security: restrict file operations to these directories (set via addon preferences)
 SAFE_MODE = False
 ALLOWED_PATHS: list[str] = []
-TOOL_WHITELIST: set[str] | None = None  # None = all tools allowed
+_ALLOWED_PREFIXES: tuple[str, ...] = ()  # Normalised ALLOWED_PATHS, see _refresh_allowed_prefixes()
+_PATH_SETTINGS: tuple[bool, str] | None = None  # (safe_mode, approved_script_roots) the path lists were built from
+TOOL_WHITELIST: frozenset[str] | None = None  # None = all tools allowed
 
 # Python execution settings (set via addon preferences)
 ALLOW_INLINE_CODE = True
@@ -92,6 +135,81 @@ def _cap_output(text: str) -> str:
     return text[:MAX_OUTPUT_SIZE] + f"\n… (truncated, {len(text)} total chars)"
 
 
+def _json_loads(data: bytes | bytearray) -> Any:
+    """Decode a wire message; orjson errors subclass json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(value: Any) -> bytes:
+    """Encode a wire message to bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; the stdlib encoder handles them
+    return json.dumps(value).encode()
+
+
+class RawJSON(bytes):
+    """A result that is already encoded JSON, such as a cached query; it is spliced into the response as-is."""
+
+    __slots__ = ()
+
+
+def _encode_response(response: dict) -> bytes:
+    """Encode a response, splicing in a RawJSON result instead of encoding it again."""
+    result = response.get("result")
+    if type(result) is not RawJSON:
+        return _json_dumps(response)
+    envelope = {key: value for key, value in response.items() if key != "result"}
+    return b"".join((_json_dumps(envelope)[:-1], b',"result":', result, b"}"))
+
+
+def _should_stream(response: dict) -> bool:
+    """True when a response's result holds a list large enough to encode incrementally.
+
+    Legacy newline clients only: a length-prefixed frame needs its size up
+    front, so framed clients (every client this package ships) get one frame.
+    """
+    result = response.get("result")
+    if not isinstance(result, dict) or not all(type(key) is str for key in result):
+        return False
+    return any(isinstance(value, list) and len(value) >= STREAM_MIN_ITEMS for value in result.values())
+
+
+def _iter_response_chunks(response: dict) -> Iterator[bytes]:
+    """Encode a response piece by piece.
+
+    Large result lists are encoded ``STREAM_CHUNK_ITEMS`` at a time, so the
+    full JSON document never has to exist as one bytes object.
+    """
+    envelope = {key: value for key, value in response.items() if key != "result"}
+    yield _json_dumps(envelope)[:-1] + b',"result":{'
+    for index, (key, value) in enumerate(response["result"].items()):
+        prefix = (b"," if index else b"") + _json_dumps(key) + b":"
+        if isinstance(value, list) and len(value) >= STREAM_MIN_ITEMS:
+            yield prefix + b"["
+            for start in range(0, len(value), STREAM_CHUNK_ITEMS):
+                chunk = b",".join([_json_dumps(item) for item in value[start : start + STREAM_CHUNK_ITEMS]])
+                yield b"," + chunk if start else chunk
+            yield b"]"
+        else:
+            yield prefix + _json_dumps(value)
+    yield b"}}"
+
+
+def _collection_locations(objects) -> list[list[float]]:
+    """Read every object's location in one RNA call when numpy is available."""
+    foreach_get = getattr(objects, "foreach_get", None)
+    if np is None or foreach_get is None:
+        return [list(obj.location) for obj in objects]
+    flat = np.empty(len(objects) * 3, dtype=np.float32)
+    foreach_get("location", flat)
+    return flat.reshape(-1, 3).tolist()
+
+
 def _build_cube_pydata(
     size: float,
 ) -> tuple[list[tuple[float, float, float]], list[tuple[int, ...]]]:
@@ -251,20 +369,23 @@ def _build_torus_pydata(
     return verts, faces
 
 
+# Primitive name -> pydata builder; module-level so create_mesh does not rebuild it per call
+_PRIMITIVE_BUILDERS = {
+    "cube": _build_cube_pydata,
+    "sphere": _build_uv_sphere_pydata,
+    "cylinder": _build_cylinder_pydata,
+    "plane": _build_plane_pydata,
+    "cone": _build_cone_pydata,
+    "torus": _build_torus_pydata,
+}
+
+
 def _build_primitive_pydata(
     mesh_type: str, size: float
 ) -> tuple[list[tuple[float, float, float]], list[tuple[int, ...]]]:
-    builders = {
-        "cube": _build_cube_pydata,
-        "sphere": _build_uv_sphere_pydata,
-        "cylinder": _build_cylinder_pydata,
-        "plane": _build_plane_pydata,
-        "cone": _build_cone_pydata,
-        "torus": _build_torus_pydata,
-    }
-    builder = builders.get(mesh_type)
+    builder = _PRIMITIVE_BUILDERS.get(mesh_type)
     if builder is None:
-        raise ValueError(f"Unknown mesh type: {mesh_type}. Options: {list(builders.keys())}")
+        raise ValueError(f"Unknown mesh type: {mesh_type}. Options: {list(_PRIMITIVE_BUILDERS)}")
     return builder(size)
 
 
@@ -340,7 +461,7 @@ def _get_addon_preferences():
 
 def _sync_runtime_settings():
     """Apply add-on preferences to module-level runtime settings."""
-    global SAFE_MODE, PORT, ALLOW_INLINE_CODE, APPROVED_SCRIPT_ROOTS, ALLOWED_PATHS
+    global SAFE_MODE, PORT, ALLOW_INLINE_CODE, APPROVED_SCRIPT_ROOTS, ALLOWED_PATHS, _PATH_SETTINGS
 
     prefs = _get_addon_preferences()
     if prefs is None:
@@ -351,6 +472,10 @@ def _sync_runtime_settings():
     ALLOW_INLINE_CODE = bool(getattr(prefs, "allow_inline_code", ALLOW_INLINE_CODE))
 
     raw_roots = getattr(prefs, "approved_script_roots", "") or ""
+    # Runs before every command; only resolve the roots again when the preferences changed
+    if (SAFE_MODE, raw_roots) == _PATH_SETTINGS:
+        return
+    _PATH_SETTINGS = (SAFE_MODE, raw_roots)
     path_helper = getattr(getattr(bpy, "path", None), "abspath", None)
     approved_roots = []
     for root in raw_roots.split(";"):
@@ -362,43 +487,113 @@ def _sync_runtime_settings():
 
     APPROVED_SCRIPT_ROOTS = approved_roots
     ALLOWED_PATHS = approved_roots.copy() if SAFE_MODE else []
+    _refresh_allowed_prefixes()
+
+
+def _refresh_allowed_prefixes():
+    """Rebuild the normalised prefix tuple; call whenever ALLOWED_PATHS changes."""
+    global _ALLOWED_PREFIXES
+    _ALLOWED_PREFIXES = tuple(os.path.abspath(allowed) for allowed in ALLOWED_PATHS)
+
+
+def _validate_filepath(filepath: str) -> str:
+    """Security: validate that a filepath is within allowed directories."""
+    if not SAFE_MODE:
+        return filepath
+    abs_path = os.path.abspath(bpy.path.abspath(filepath))
+    allowed, prefixes = ALLOWED_PATHS, _ALLOWED_PREFIXES
+    if not allowed:
+        # In safe mode with no allowed paths, only allow the blend file directory; it follows Save As
+        blend_dir = os.path.dirname(bpy.data.filepath) if bpy.data.filepath else os.getcwd()
+        allowed, prefixes = [blend_dir], (os.path.abspath(blend_dir),)
+    if abs_path.startswith(prefixes):
+        return filepath
+    raise PermissionError(f"File access denied: '{filepath}' is outside allowed directories. Allowed: {allowed}")
+
+
+# Bumped whenever Blender data may have changed; cached query results from older versions are stale
+_scene_version = 0
+
+
+def _bump_scene_version():
+    global _scene_version
+    _scene_version += 1
+
+
+@persistent
+def _on_scene_changed(*_args):
+    """Blender handler wrapper; the bridge itself calls _bump_scene_version directly."""
+    _bump_scene_version()
 
 
 class CommandHandler:
     """Dispatches JSON commands to the appropriate bpy operations."""
 
-    def __init__(self):
-        self._handlers: dict[str, callable] = {}
-        self._register_builtins()
-
-    def _register_builtins(self):
-        self._handlers["scene.get_info"] = self._scene_get_info
-        self._handlers["scene.list_objects"] = self._scene_list_objects
-        self._handlers["object.get_transform"] = self._object_get_transform
-        self._handlers["object.get_hierarchy"] = self._object_get_hierarchy
-        self._handlers["material.list"] = self._material_list
-        self._handlers["object.create_mesh"] = self._object_create_mesh
-        self._handlers["object.delete"] = self._object_delete
-        self._handlers["object.translate"] = self._object_translate
-        self._handlers["object.rotate"] = self._object_rotate
-        self._handlers["object.scale"] = self._object_scale
-        self._handlers["object.duplicate"] = self._object_duplicate
-        self._handlers["material.create"] = self._material_create
-        self._handlers["material.assign"] = self._material_assign
-        self._handlers["material.set_color"] = self._material_set_color
-        self._handlers["material.set_texture"] = self._material_set_texture
-        self._handlers["render.still"] = self._render_still
-        self._handlers["render.animation"] = self._render_animation
-        self._handlers["export.gltf"] = self._export_gltf
-        self._handlers["export.obj"] = self._export_obj
-        self._handlers["export.fbx"] = self._export_fbx
-        self._handlers["history.undo"] = self._history_undo
-        self._handlers["history.redo"] = self._history_redo
-        self._handlers["python.execute"] = self._python_execute
-        self._handlers["python.execute_async"] = self._python_execute_async
-        self._handlers["job.status"] = self._job_status
-        self._handlers["job.cancel"] = self._job_cancel
-        self._handlers["job.list"] = self._job_list
+    __slots__ = ("_bsdf_cache", "_object_cache", "_result_cache")
+
+    # Commands after which cached RNA references may point at freed or replaced data
+    _CACHE_INVALIDATING = frozenset(
+        {
+            "object.create_mesh",
+            "object.delete",
+            "object.duplicate",
+            "history.undo",
+            "history.redo",
+            "python.execute",
+        }
+    )
+
+    # Commands that never modify Blender data, so they leave cached query results valid
+    _READ_ONLY = frozenset(
+        {
+            "scene.get_info",
+            "scene.list_objects",
+            "object.get_transform",
+            "object.get_hierarchy",
+            "material.list",
+            "job.status",
+            "job.list",
+        }
+    )
+
+    # Read-only queries whose results are encoded once and reused as RawJSON until _scene_version changes
+    _RESULT_CACHED = frozenset({"scene.get_info", "material.list"})
+
+    # Command name -> handler method name, resolved with getattr() at dispatch time
+    _HANDLERS: dict[str, str] = {
+        "scene.get_info": "_scene_get_info",
+        "scene.list_objects": "_scene_list_objects",
+        "object.get_transform": "_object_get_transform",
+        "object.get_hierarchy": "_object_get_hierarchy",
+        "material.list": "_material_list",
+        "object.create_mesh": "_object_create_mesh",
+        "object.delete": "_object_delete",
+        "object.translate": "_object_translate",
+        "object.rotate": "_object_rotate",
+        "object.scale": "_object_scale",
+        "object.bulk_transform": "_object_bulk_transform",
+        "object.duplicate": "_object_duplicate",
+        "material.create": "_material_create",
+        "material.assign": "_material_assign",
+        "material.set_color": "_material_set_color",
+        "material.set_texture": "_material_set_texture",
+        "render.still": "_render_still",
+        "render.animation": "_render_animation",
+        "export.gltf": "_export_gltf",
+        "export.obj": "_export_obj",
+        "export.fbx": "_export_fbx",
+        "history.undo": "_history_undo",
+        "history.redo": "_history_redo",
+        "python.execute": "_python_execute",
+        "python.execute_async": "_python_execute_async",
+        "job.status": "_job_status",
+        "job.cancel": "_job_cancel",
+        "job.list": "_job_list",
+        "batch": "_batch",
+    }
+
+    # Interned keys let interned incoming command names match by identity during hash probes
+    _HANDLERS = {sys.intern(command): method for command, method in _HANDLERS.items()}
 
     _VALIDATORS: dict[str, type] = {
         "scene.list_objects": SceneListObjectsParams,
@@ -409,6 +604,7 @@ class CommandHandler:
         "object.translate": ObjectTranslateParams,
         "object.rotate": ObjectRotateParams,
         "object.scale": ObjectScaleParams,
+        "object.bulk_transform": ObjectBulkTransformParams,
         "object.duplicate": ObjectDuplicateParams,
         "material.create": MaterialCreateParams,
         "material.assign": MaterialAssignParams,
@@ -423,39 +619,72 @@ class CommandHandler:
         "python.execute_async": PythonExecuteParams,
         "job.status": JobIdParams,
         "job.cancel": JobIdParams,
+        "batch": BatchParams,
     }
 
+    def __init__(self):
+        # Both caches hold RNA references that are only valid until the next reset_caches()
+        self._bsdf_cache: dict[int, Any] = {}  # Material pointer -> Principled BSDF node
+        self._object_cache: dict[str, Any] = {}  # Object name -> object
+        # Command -> (_scene_version, encoded result); plain data, so it survives reset_caches()
+        self._result_cache: dict[str, tuple[int, RawJSON]] = {}
+
+    def reset_caches(self) -> None:
+        """Drop cached RNA references; call before Blender gets a chance to change the data under them."""
+        self._bsdf_cache.clear()
+        self._object_cache.clear()
+
     def handle(self, command: str, params: dict) -> Any:
         _sync_runtime_settings()
         # Security: check tool whitelist
         if TOOL_WHITELIST is not None and command not in TOOL_WHITELIST:
             raise PermissionError(f"Command '{command}' is not in the tool whitelist")
-        handler = self._handlers.get(command)
-        if not handler:
-            raise ValueError(f"Unknown command: {command}")
+        try:
+            method_name = self._HANDLERS[command]
+        except KeyError:
+            raise ValueError(f"Unknown command: {command}") from None
         validator = self._VALIDATORS.get(command)
         if validator is not None:
             params = validator.model_validate(params).model_dump(exclude_none=True)
-        return handler(params)
+        if command in self._RESULT_CACHED:
+            cached = self._result_cache.get(command)
+            if cached is not None and cached[0] == _scene_version:
+                return cached[1]
+            encoded = RawJSON(_json_dumps(getattr(self, method_name)(params)))
+            self._result_cache[command] = (_scene_version, encoded)
+            return encoded
+        if command not in self._READ_ONLY:
+            _bump_scene_version()
+        if command not in self._CACHE_INVALIDATING:
+            return getattr(self, method_name)(params)
+        try:
+            return getattr(self, method_name)(params)
+        finally:
+            self.reset_caches()
 
     # -- Scene tools --
 
+    def _lookup_object(self, name: str):
+        """``bpy.data.objects.get`` memoised until the next reset_caches(); misses are not cached."""
+        obj = self._object_cache.get(name)
+        if obj is None:
+            obj = bpy.data.objects.get(name)
+            if obj is not None:
+                self._object_cache[name] = obj
+        return obj
+
+    def _resolve_object(self, name: str):
+        obj = self._lookup_object(name)
+        if obj is None:
+            raise ValueError(f"Object '{name}' not found")
+        return obj
+
     @staticmethod
-    def _validate_filepath(filepath: str) -> str:
-        """Security: validate that a filepath is within allowed directories."""
-        if not SAFE_MODE:
-            return filepath
-        abs_path = os.path.abspath(bpy.path.abspath(filepath))
-        if not ALLOWED_PATHS:
-            # In safe mode with no allowed paths, only allow the blend file directory
-            blend_dir = os.path.dirname(bpy.data.filepath) if bpy.data.filepath else os.getcwd()
-            ALLOWED_PATHS.append(blend_dir)
-        for allowed in ALLOWED_PATHS:
-            if abs_path.startswith(os.path.abspath(allowed)):
-                return filepath
-        raise PermissionError(
-            f"File access denied: '{filepath}' is outside allowed directories. Allowed: {ALLOWED_PATHS}"
-        )
+    def _resolve_material(name: str):
+        mat = bpy.data.materials.get(name)
+        if mat is None:
+            raise ValueError(f"Material '{name}' not found")
+        return mat
 
     def _scene_get_info(self, params: dict) -> dict:
         scene = bpy.context.scene
@@ -472,25 +701,26 @@ class CommandHandler:
 
     def _scene_list_objects(self, params: dict) -> dict:
         type_filter = params.get("type")
-        objects = []
-        for obj in bpy.context.scene.objects:
-            if type_filter and obj.type != type_filter.upper():
-                continue
-            objects.append(
+        wanted = type_filter.upper() if type_filter else None
+        objects = bpy.context.scene.objects
+        locations = _collection_locations(objects)
+        return {
+            "objects": [
                 {
                     "name": obj.name,
-                    "type": obj.type,
-                    "location": list(obj.location),
+                    # A filtered object's type is already known; skip the second RNA read
+                    "type": wanted or obj.type,
+                    "location": locations[i],
                     "visible": obj.visible_get(),
                 }
-            )
-        return {"objects": objects}
+                for i, obj in enumerate(objects)
+                if wanted is None or obj.type == wanted
+            ]
+        }
 
     def _object_get_transform(self, params: dict) -> dict:
         name = params["name"]
-        obj = bpy.data.objects.get(name)
-        if not obj:
-            raise ValueError(f"Object '{name}' not found")
+        obj = self._resolve_object(name)
         return {
             "name": obj.name,
             "location": list(obj.location),
@@ -498,23 +728,39 @@ class CommandHandler:
             "scale": list(obj.scale),
         }
 
-    def _object_get_hierarchy(self, params: dict) -> dict:
-        def build_tree(obj):
-            return {
-                "name": obj.name,
-                "type": obj.type,
-                "children": [build_tree(c) for c in obj.children],
-            }
+    @staticmethod
+    def _build_hierarchy(root) -> dict:
+        """Build a nested {name, type, children} tree under one object without recursing per node."""
+        tree: dict[str, Any] = {"name": root.name, "type": root.type, "children": []}
+        stack = [(root, tree)]
+        while stack:
+            obj, node = stack.pop()
+            for child in obj.children:
+                child_node: dict[str, Any] = {"name": child.name, "type": child.type, "children": []}
+                node["children"].append(child_node)
+                stack.append((child, child_node))
+        return tree
 
+    def _object_get_hierarchy(self, params: dict) -> dict:
         name = params.get("name")
         if name:
-            obj = bpy.data.objects.get(name)
-            if not obj:
-                raise ValueError(f"Object '{name}' not found")
-            return build_tree(obj)
+            return self._build_hierarchy(self._resolve_object(name))
 
-        roots = [o for o in bpy.context.scene.objects if o.parent is None]
-        return {"roots": [build_tree(r) for r in roots]}
+        # Two flat passes instead of a walk: one node per object, then link each under its parent.
+        # Object.children is avoided here because Blender computes it by scanning every object.
+        nodes: dict[str, dict[str, Any]] = {}
+        links = []
+        for obj in bpy.context.scene.objects:
+            node: dict[str, Any] = {"name": obj.name, "type": obj.type, "children": []}
+            nodes[node["name"]] = node
+            links.append((node, obj.parent))
+        roots = []
+        for node, parent in links:
+            if parent is None:
+                roots.append(node)
+            elif (parent_node := nodes.get(parent.name)) is not None:
+                parent_node["children"].append(node)
+        return {"roots": roots}
 
     def _material_list(self, params: dict) -> dict:
         materials = []
@@ -545,55 +791,67 @@ class CommandHandler:
 
     def _object_delete(self, params: dict) -> dict:
         name = params["name"]
-        obj = bpy.data.objects.get(name)
-        if not obj:
-            raise ValueError(f"Object '{name}' not found")
+        obj = self._resolve_object(name)
         bpy.data.objects.remove(obj, do_unlink=True)
         return {"deleted": name}
 
     def _object_translate(self, params: dict) -> dict:
         name = params["name"]
-        obj = bpy.data.objects.get(name)
-        if not obj:
-            raise ValueError(f"Object '{name}' not found")
+        obj = self._resolve_object(name)
         offset = params.get("offset", [0, 0, 0])
         absolute = params.get("location")
+        # Slice assignment writes into the existing Vector instead of building a new one
+        location = obj.location
         if absolute:
-            obj.location = absolute
+            location[:] = absolute
         else:
-            obj.location.x += offset[0]
-            obj.location.y += offset[1]
-            obj.location.z += offset[2]
-        return {"name": obj.name, "location": list(obj.location)}
+            dx, dy, dz = offset
+            location[:] = (location[0] + dx, location[1] + dy, location[2] + dz)
+        return {"name": obj.name, "location": list(location)}
 
     def _object_rotate(self, params: dict) -> dict:
-        import math
-
         name = params["name"]
-        obj = bpy.data.objects.get(name)
-        if not obj:
-            raise ValueError(f"Object '{name}' not found")
+        obj = self._resolve_object(name)
         rotation = params.get("rotation", [0, 0, 0])
         degrees = params.get("degrees", True)
         if degrees:
-            rotation = [math.radians(r) for r in rotation]
-        obj.rotation_euler = rotation
+            rx, ry, rz = rotation
+            rotation = (rx * _DEG2RAD, ry * _DEG2RAD, rz * _DEG2RAD)
+        obj.rotation_euler[:] = rotation
         return {"name": obj.name, "rotation_euler": list(obj.rotation_euler)}
 
     def _object_scale(self, params: dict) -> dict:
         name = params["name"]
-        obj = bpy.data.objects.get(name)
-        if not obj:
-            raise ValueError(f"Object '{name}' not found")
+        obj = self._resolve_object(name)
         scale = params.get("scale", [1, 1, 1])
-        obj.scale = scale
+        obj.scale[:] = scale
         return {"name": obj.name, "scale": list(obj.scale)}
 
+    def _object_bulk_transform(self, params: dict) -> dict:
+        degrees = params.get("degrees", True)
+        updated = []
+        missing = []
+        for item in params["items"]:
+            obj = self._lookup_object(item["name"])
+            if obj is None:
+                missing.append(item["name"])
+                continue
+            if "location" in item:
+                obj.location[:] = item["location"]
+            if "rotation" in item:
+                rotation = item["rotation"]
+                if degrees:
+                    rx, ry, rz = rotation
+                    rotation = (rx * _DEG2RAD, ry * _DEG2RAD, rz * _DEG2RAD)
+                obj.rotation_euler[:] = rotation
+            if "scale" in item:
+                obj.scale[:] = item["scale"]
+            updated.append(obj.name)
+        return {"updated": updated, "missing": missing}
+
     def _object_duplicate(self, params: dict) -> dict:
         name = params["name"]
-        obj = bpy.data.objects.get(name)
-        if not obj:
-            raise ValueError(f"Object '{name}' not found")
+        obj = self._resolve_object(name)
         new_obj = obj.copy()
         new_obj.data = obj.data.copy()
         new_name = params.get("new_name")
@@ -608,6 +866,16 @@ class CommandHandler:
 
     # -- Material tools --
 
+    def _get_bsdf(self, mat):
+        """Return the material's Principled BSDF node, memoised until the next reset_caches()."""
+        key = mat.as_pointer()
+        bsdf = self._bsdf_cache.get(key)
+        if bsdf is None:
+            bsdf = mat.node_tree.nodes.get("Principled BSDF")
+            if bsdf is not None:
+                self._bsdf_cache[key] = bsdf
+        return bsdf
+
     def _material_create(self, params: dict) -> dict:
         name = params.get("name", "Material")
         mat = bpy.data.materials.new(name=name)
@@ -624,12 +892,8 @@ class CommandHandler:
     def _material_assign(self, params: dict) -> dict:
         obj_name = params["object"]
         mat_name = params["material"]
-        obj = bpy.data.objects.get(obj_name)
-        if not obj:
-            raise ValueError(f"Object '{obj_name}' not found")
-        mat = bpy.data.materials.get(mat_name)
-        if not mat:
-            raise ValueError(f"Material '{mat_name}' not found")
+        obj = self._resolve_object(obj_name)
+        mat = self._resolve_material(mat_name)
         if obj.data.materials:
             obj.data.materials[0] = mat
         else:
@@ -639,12 +903,10 @@ class CommandHandler:
     def _material_set_color(self, params: dict) -> dict:
         mat_name = params["name"]
         color = params["color"]  # [r, g, b] or [r, g, b, a]
-        mat = bpy.data.materials.get(mat_name)
-        if not mat:
-            raise ValueError(f"Material '{mat_name}' not found")
+        mat = self._resolve_material(mat_name)
         if not mat.use_nodes:
             mat.use_nodes = True
-        bsdf = mat.node_tree.nodes.get("Principled BSDF")
+        bsdf = self._get_bsdf(mat)
         if not bsdf:
             raise ValueError(f"Material '{mat_name}' has no Principled BSDF node")
         rgba = list(color) + [1.0] * (4 - len(color))
@@ -654,14 +916,12 @@ class CommandHandler:
     def _material_set_texture(self, params: dict) -> dict:
         mat_name = params["name"]
         filepath = params["filepath"]
-        self._validate_filepath(filepath)
-        mat = bpy.data.materials.get(mat_name)
-        if not mat:
-            raise ValueError(f"Material '{mat_name}' not found")
+        _validate_filepath(filepath)
+        mat = self._resolve_material(mat_name)
         if not mat.use_nodes:
             mat.use_nodes = True
         tree = mat.node_tree
-        bsdf = tree.nodes.get("Principled BSDF")
+        bsdf = self._get_bsdf(mat)
         if not bsdf:
             raise ValueError(f"Material '{mat_name}' has no Principled BSDF node")
         tex_node = tree.nodes.new("ShaderNodeTexImage")
@@ -674,7 +934,7 @@ class CommandHandler:
     def _render_still(self, params: dict) -> dict:
         scene = bpy.context.scene
         output_path = params.get("output_path", "//render.png")
-        self._validate_filepath(output_path)
+        _validate_filepath(output_path)
         resolution_x = params.get("resolution_x")
         resolution_y = params.get("resolution_y")
         engine = params.get("engine")
@@ -686,19 +946,25 @@ class CommandHandler:
         if resolution_y:
             scene.render.resolution_y = resolution_y
 
-        scene.render.filepath = output_path
-        bpy.ops.render.render(write_still=True)
         abs_path = bpy.path.abspath(output_path)
-        return {
+        summary = {
             "output_path": abs_path,
             "engine": scene.render.engine,
             "resolution": [scene.render.resolution_x, scene.render.resolution_y],
         }
+        if params.get("background"):
+            # Same operator call as below, run against the snapshot in the child process
+            scene.render.filepath = abs_path
+            return self._render_in_background(["--python-expr", _RENDER_STILL_EXPR], summary)
+
+        scene.render.filepath = output_path
+        bpy.ops.render.render(write_still=True)
+        return summary
 
     def _render_animation(self, params: dict) -> dict:
         scene = bpy.context.scene
         output_path = params.get("output_path", "//render_")
-        self._validate_filepath(output_path)
+        _validate_filepath(output_path)
         frame_start = params.get("frame_start")
         frame_end = params.get("frame_end")
         engine = params.get("engine")
@@ -710,20 +976,46 @@ class CommandHandler:
         if frame_end is not None:
             scene.frame_end = frame_end
 
-        scene.render.filepath = output_path
-        bpy.ops.render.render(animation=True)
         abs_path = bpy.path.abspath(output_path)
-        return {
+        summary = {
             "output_path": abs_path,
             "frame_range": [scene.frame_start, scene.frame_end],
             "engine": scene.render.engine,
         }
+        if params.get("background"):
+            scene.render.filepath = abs_path
+            return self._render_in_background(["--render-anim"], summary)
+
+        scene.render.filepath = output_path
+        bpy.ops.render.render(animation=True)
+        return summary
+
+    @staticmethod
+    def _render_in_background(render_args: list[str], summary: dict) -> dict:
+        """Render a snapshot of the open file in a child Blender process, tracked as a job.
+
+        The child owns its own interpreter, so Blender's UI and the bridge keep
+        serving commands while it renders. Poll the returned job with job.status.
+        """
+        if not bpy.app.binary_path:
+            raise RuntimeError("Background rendering needs a Blender executable; bpy.app.binary_path is empty")
+        fd, snapshot = tempfile.mkstemp(prefix="mcp_render_", suffix=".blend")
+        os.close(fd)
+        try:
+            bpy.ops.wm.save_as_mainfile(filepath=snapshot, copy=True)
+        except BaseException:
+            with suppress(OSError):
+                os.remove(snapshot)
+            raise
+        argv = [bpy.app.binary_path, "--background", snapshot, *render_args]
+        job_id = _job_manager.create_process_job(argv, cleanup_path=snapshot)
+        return {**summary, "job_id": job_id, "status": "running"}
 
     # -- Export tools --
 
     def _export_gltf(self, params: dict) -> dict:
         filepath = params["filepath"]
-        self._validate_filepath(filepath)
+        _validate_filepath(filepath)
         if not filepath.endswith((".glb", ".gltf")):
             filepath += ".glb"
         bpy.ops.export_scene.gltf(filepath=filepath)
@@ -731,7 +1023,7 @@ class CommandHandler:
 
     def _export_obj(self, params: dict) -> dict:
         filepath = params["filepath"]
-        self._validate_filepath(filepath)
+        _validate_filepath(filepath)
         if not filepath.endswith(".obj"):
             filepath += ".obj"
         bpy.ops.wm.obj_export(filepath=filepath)
@@ -739,7 +1031,7 @@ class CommandHandler:
 
     def _export_fbx(self, params: dict) -> dict:
         filepath = params["filepath"]
-        self._validate_filepath(filepath)
+        _validate_filepath(filepath)
         if not filepath.endswith(".fbx"):
             filepath += ".fbx"
         bpy.ops.export_scene.fbx(filepath=filepath)
@@ -854,6 +1146,8 @@ class CommandHandler:
             }
         finally:
             sys.settrace(previous_trace)
+            # Scripts can touch any data, including from async jobs that finish later
+            _bump_scene_version()
 
         elapsed = time.monotonic() - start
         logger.info(
@@ -949,6 +1243,28 @@ class CommandHandler:
     def _job_list(self, params: dict) -> dict:
         return _job_manager.list_jobs()
 
+    # -- Batching --
+
+    def _batch(self, params: dict) -> dict:
+        """Run several commands in one request; each item succeeds or fails on its own."""
+        results = []
+        for item in params["commands"]:
+            command = sys.intern(item["command"])
+            try:
+                if command == "batch":
+                    raise ValueError("Nested batch commands are not supported")
+                result = self.handle(command, item["params"])
+                if type(result) is RawJSON:
+                    result = _json_loads(bytes(result))  # The batch envelope is encoded as a whole
+                results.append({"success": True, "result": result})
+            except Exception as e:
+                results.append({"success": False, "error": str(e)})
+        return {"results": results}
+
+
+_RENDER_STILL_EXPR = "import bpy; bpy.ops.render.render(write_still=True)"
+PROCESS_POLL_INTERVAL = 0.25  # Seconds between timer checks on a background render process
+
 
 class JobManager:
     """Manages async job lifecycle for long-running Blender scripts."""
@@ -1043,6 +1359,87 @@ class JobManager:
             "error_summary": _truncate(job["error"], 200) if job.get("error") else None,
         }
 
+    def create_process_job(self, argv: list[str], cleanup_path: str | None = None) -> str:
+        """Start ``argv`` as a child process and track it with the same lifecycle as script jobs."""
+        job_id = f"job-{uuid.uuid4().hex[:8]}"
+        now = time.time()
+        # Temporary files instead of pipes: nothing reads them until exit, and a full pipe would stall the child.
+        # They outlive this call and are closed by _poll_process_job.
+        outputs = (tempfile.TemporaryFile(), tempfile.TemporaryFile())  # noqa: SIM115
+        try:
+            process = subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=outputs[0], stderr=outputs[1])
+        except OSError:
+            for output in outputs:
+                output.close()
+            if cleanup_path:
+                with suppress(OSError):
+                    os.remove(cleanup_path)
+            raise
+
+        job = {
+            "job_id": job_id,
+            "status": "running",
+            "cancellation_requested": False,
+            "created_at": now,
+            "started_at": now,
+            "completed_at": None,
+            "result": None,
+            "stdout": "",
+            "stderr": "",
+            "error": None,
+            "cancel_event": threading.Event(),
+            "process": process,
+            "output_files": outputs,
+            "cleanup_path": cleanup_path,
+        }
+
+        with self._lock:
+            self._jobs[job_id] = job
+
+        logger.info("Job [%s] started process %s", job_id, process.pid)
+        # persistent=True keeps polling across file loads so the child is still reaped and its files removed
+        bpy.app.timers.register(
+            lambda: self._poll_process_job(job_id), first_interval=PROCESS_POLL_INTERVAL, persistent=True
+        )
+        return job_id
+
+    def _poll_process_job(self, job_id: str) -> float | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if not job:
+            return None
+
+        process = job["process"]
+        if job["cancel_event"].is_set() and process.poll() is None:
+            process.terminate()
+        returncode = process.poll()
+        if returncode is None:
+            return PROCESS_POLL_INTERVAL
+
+        outputs = []
+        for output in job["output_files"]:
+            output.seek(0)
+            outputs.append(output.read().decode("utf-8", errors="replace"))
+            output.close()
+        if job["cleanup_path"]:
+            with suppress(OSError):
+                os.remove(job["cleanup_path"])
+
+        with self._lock:
+            job["stdout"], job["stderr"] = outputs
+            job["result"] = {"returncode": returncode}
+            if job["cancel_event"].is_set():
+                job["status"] = "cancelled"
+            elif returncode:
+                job["status"] = "failed"
+                job["error"] = f"Process exited with code {returncode}"
+            else:
+                job["status"] = "succeeded"
+            job["completed_at"] = time.time()
+
+        logger.info("Job [%s] %s in %.3fs", job_id, job["status"], job["completed_at"] - job["started_at"])
+        return None
+
     def get_status(self, job_id: str) -> dict:
         with self._lock:
             job = self._jobs.get(job_id)
@@ -1100,17 +1497,80 @@ class JobManager:
 _job_manager = JobManager()
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the bridge's event loop, preferring uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def _unix_socket_path() -> str | None:
+    """The Unix socket path to serve on, or None to serve TCP."""
+    if TRANSPORT != "unix":
+        return None
+    if not hasattr(socket, "AF_UNIX") or not SOCKET_PATH:
+        logger.warning("Unix sockets are not available on this platform; using TCP")
+        return None
+    return SOCKET_PATH
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Unlink a socket file left behind by a session that exited without cleaning up."""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        # Connecting to a regular file is refused too; never unlink something that isn't a socket
+        raise OSError(errno.EADDRINUSE, f"{path} exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except FileNotFoundError:
+        return
+    except ConnectionRefusedError:
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise OSError(errno.EADDRINUSE, f"Another process is serving on {path}")
+
+
+def _configure_client_socket(sock: socket.socket | None) -> None:
+    """Apply latency-oriented socket options to an accepted client connection."""
+    if sock is None:
+        return
+    if sock.family != getattr(socket, "AF_UNIX", None):
+        # Responses are small and immediately awaited; never hold them back for Nagle coalescing.
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Let the OS reap peers that vanished without closing the connection.
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # Room for a large scene dump in a few syscalls rather than many window-sized ones.
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+
+
 class BlenderMCPServer:
-    """TCP socket server running inside Blender."""
+    """TCP socket server running inside Blender.
+
+    Client I/O runs on a single asyncio event loop in a background thread.
+    Commands are handed to Blender's main thread through ``_request_queue``,
+    which a ``bpy.app.timers`` callback drains.
+    """
 
     def __init__(self):
-        self._server_socket: socket.socket | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._thread: threading.Thread | None = None
         self._running = False
         self._host = HOST
         self._port = PORT
+        self._unix_path: str | None = None
+        self._unix_file_id: tuple[int, int] | None = None  # (st_dev, st_ino) of the socket file we bound
         self._handler = CommandHandler()
-        self._request_queue: queue.Queue[dict[str, Any]] = queue.Queue()
+        self._clients: set[asyncio.StreamWriter] = set()
+        # SimpleQueue: one producer thread, one consumer, no task_done()/join() bookkeeping needed
+        self._request_queue: queue.SimpleQueue[tuple[dict[str, Any], concurrent.futures.Future]] = queue.SimpleQueue()
 
     def start(self):
         if self._running:
@@ -1118,125 +1578,246 @@ class BlenderMCPServer:
         _sync_runtime_settings()
         self._host = HOST
         self._port = PORT
-        self._server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self._server_socket.settimeout(1.0)
+        self._unix_path = _unix_socket_path()
+        self._loop = _new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
         try:
-            self._server_socket.bind((self._host, self._port))
+            self._server = asyncio.run_coroutine_threadsafe(self._start_server(), self._loop).result()
         except OSError as exc:
-            if self._server_socket is not None:
-                self._server_socket.close()
-                self._server_socket = None
+            self._stop_loop()
             if exc.errno == errno.EADDRINUSE:
                 logger.warning(
-                    "Blender MCP Bridge port %s already in use; skipping bridge startup",
-                    self._port,
+                    "Blender MCP Bridge address %s already in use; skipping bridge startup",
+                    self._unix_path or self._port,
                 )
                 self._running = False
                 return
             raise
+        if self._unix_path is None:
+            self._port = self._server.sockets[0].getsockname()[1]
         self._running = True
-        self._server_socket.listen(1)
-        self._thread = threading.Thread(target=self._accept_loop, daemon=True)
-        self._thread.start()
-        bpy.app.timers.register(self._drain_request_queue, first_interval=0.01)
-        logger.info(f"Blender MCP Bridge listening on {self._host}:{self._port}")
+        # persistent=True keeps the drain timer alive across file loads
+        bpy.app.timers.register(self._drain_request_queue, first_interval=0.01, persistent=True)
+        logger.info("Blender MCP Bridge listening on %s", self.address)
+
+    @property
+    def address(self) -> str:
+        """Where clients connect: the Unix socket path, or host:port."""
+        return self._unix_path or f"{self._host}:{self._port}"
 
     def stop(self):
         self._running = False
-        if self._server_socket:
-            self._server_socket.close()
-            self._server_socket = None
-        if self._thread:
-            self._thread.join(timeout=3)
-            self._thread = None
+        if self._loop is not None and self._loop.is_running():
+            shutdown = asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+            with suppress(Exception):
+                shutdown.result(timeout=3)
+        self._stop_loop()
         while not self._request_queue.empty():
-            queued = self._request_queue.get_nowait()
-            queued["response"] = {
-                "id": queued["request"].get("id"),
-                "success": False,
-                "error": "Blender MCP Bridge stopped",
-            }
-            queued["event"].set()
+            request, future = self._request_queue.get_nowait()
+            if future.set_running_or_notify_cancel():
+                future.set_result(
+                    {
+                        "id": request.get("id"),
+                        "success": False,
+                        "error": "Blender MCP Bridge stopped",
+                    }
+                )
         logger.info("Blender MCP Bridge stopped")
 
-    def _accept_loop(self):
-        while self._running:
-            try:
-                conn, addr = self._server_socket.accept()
-                logger.info(f"MCP client connected from {addr}")
-                client_thread = threading.Thread(target=self._handle_client, args=(conn,), daemon=True)
-                client_thread.start()
-            except TimeoutError:
-                continue
-            except OSError:
-                break
+    def _stop_loop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread:
+            self._thread.join(timeout=3)
+            self._thread = None
+        if self._loop is not None and not self._loop.is_running():
+            self._loop.close()
+        self._loop = None
+        self._server = None
+
+    async def _start_server(self) -> asyncio.AbstractServer:
+        if self._unix_path is not None:
+            _remove_stale_socket(self._unix_path)
+            server = await asyncio.start_unix_server(self._on_client, path=self._unix_path, limit=MAX_MESSAGE_SIZE)
+            info = os.stat(self._unix_path)
+            self._unix_file_id = (info.st_dev, info.st_ino)
+            return server
+        return await asyncio.start_server(
+            self._on_client,
+            self._host,
+            self._port,
+            reuse_address=True,
+            limit=MAX_MESSAGE_SIZE,
+        )
 
-    def _handle_client(self, conn: socket.socket):
-        conn.settimeout(None)
-        buffer = b""
+    async def _shutdown(self):
+        if self._server is not None:
+            self._server.close()
+            if self._unix_path is not None:
+                with suppress(FileNotFoundError):
+                    info = os.stat(self._unix_path)
+                    # Another instance may have replaced a path we no longer own; leave its socket alone
+                    if (info.st_dev, info.st_ino) == self._unix_file_id:
+                        os.unlink(self._unix_path)
+                self._unix_file_id = None
+        for writer in list(self._clients):
+            writer.close()
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _on_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        peer = writer.get_extra_info("peername")
+        if len(self._clients) >= MAX_CLIENTS:
+            logger.warning("Refusing MCP client %s: %d clients already connected", peer, MAX_CLIENTS)
+            writer.close()
+            return
+        logger.info("MCP client connected from %s", peer)
+        _configure_client_socket(writer.get_extra_info("socket"))
+        self._clients.add(writer)
         try:
-            while self._running:
-                data = conn.recv(BUFFER_SIZE)
-                if not data:
-                    break
-                buffer += data
-                # Messages are newline-delimited JSON
-                while b"\n" in buffer:
-                    line, buffer = buffer.split(b"\n", 1)
-                    if not line.strip():
-                        continue
+            # Framing is detected once per connection from the first byte the client sends
+            try:
+                pending = await reader.readexactly(1)
+            except asyncio.IncompleteReadError:
+                return
+            framed = pending[0] not in _LEGACY_FIRST_BYTES
+            # Requests are queued for the main thread as soon as they are read, so a client that
+            # pipelines several gets them all run in one drain tick; replies go out in request order.
+            responses: asyncio.Queue[asyncio.Future | None] = asyncio.Queue(MAX_PIPELINED_REQUESTS)
+            write_task = asyncio.create_task(self._write_responses(writer, responses, framed))
+            try:
+                while self._running:
                     try:
-                        request = json.loads(line)
-                        response = self._submit_request(request)
-                    except json.JSONDecodeError as e:
-                        response = {
-                            "id": None,
-                            "success": False,
-                            "error": f"Invalid JSON: {e}",
-                        }
-                    conn.sendall(json.dumps(response).encode() + b"\n")
+                        if framed:
+                            header = pending + await reader.readexactly(FRAME_HEADER_SIZE - len(pending))
+                            pending = b""
+                            size = int.from_bytes(header, "big")
+                            if size > MAX_MESSAGE_SIZE:
+                                logger.warning("Dropping MCP client %s: %d-byte frame exceeds limit", peer, size)
+                                break
+                            message = await reader.readexactly(size)
+                        else:
+                            message = pending + await reader.readuntil(_NL)
+                            pending = b""
+                            if not message.strip():
+                                continue
+                    except asyncio.IncompleteReadError:
+                        break
+                    await responses.put(self._dispatch_message(message))
+            finally:
+                # Flush replies to everything already read before closing
+                await responses.put(None)
+                await write_task
+        except asyncio.CancelledError:
+            # stop() cancels every task on the loop; end quietly so asyncio doesn't log a traceback per client
+            pass
         except Exception as e:
-            logger.error(f"Client handler error: {e}")
+            logger.error("Client handler error: %s", e)
         finally:
-            conn.close()
+            self._clients.discard(writer)
+            writer.close()
+
+    def _dispatch_message(self, message: bytes) -> asyncio.Future:
+        """Decode one request and hand it to the main thread; the future resolves to its response."""
+        try:
+            request = _json_loads(message)
+        except json.JSONDecodeError as e:
+            invalid: asyncio.Future = asyncio.get_running_loop().create_future()
+            invalid.set_result({"id": None, "success": False, "error": f"Invalid JSON: {e}"})
+            return invalid
+        if type(request) is not dict:
+            # Checked here so _process_request can assume the envelope shape on the main thread
+            invalid = asyncio.get_running_loop().create_future()
+            invalid.set_result({"id": None, "success": False, "error": "Request must be a JSON object"})
+            return invalid
+        return asyncio.wrap_future(self._enqueue_request(request))
+
+    async def _write_responses(
+        self, writer: asyncio.StreamWriter, responses: asyncio.Queue[asyncio.Future | None], framed: bool
+    ) -> None:
+        failed = False
+        while (pending := await responses.get()) is not None:
+            response = await pending
+            if failed:
+                continue  # Keep consuming so the reader never blocks on a full queue
+            try:
+                await self._write_response(writer, response, framed)
+            except Exception as e:
+                logger.error("Client write error: %s", e)
+                failed = True
+                writer.close()  # The reader sees EOF and stops
+
+    @staticmethod
+    async def _write_response(writer: asyncio.StreamWriter, response: dict, framed: bool) -> None:
+        if framed:
+            # The header needs the total size up front, so the payload is encoded in one call
+            payload = _encode_response(response)
+            writer.writelines((len(payload).to_bytes(FRAME_HEADER_SIZE, "big"), payload))
+        elif _should_stream(response):
+            for chunk in _iter_response_chunks(response):
+                writer.write(chunk)
+                await writer.drain()
+            writer.write(_NL)
+        else:
+            # Hand payload and delimiter over separately; the transport gathers them without concatenating
+            writer.writelines((_encode_response(response), _NL))
+        await writer.drain()
 
     # Commands that modify scene state and need undo push
-    MUTATION_COMMANDS = {
-        "object.create_mesh",
-        "object.delete",
-        "object.translate",
-        "object.rotate",
-        "object.scale",
-        "object.duplicate",
-        "material.create",
-        "material.assign",
-        "material.set_color",
-        "material.set_texture",
-    }
+    MUTATION_COMMANDS = frozenset(
+        sys.intern(command)
+        for command in {
+            "object.create_mesh",
+            "object.delete",
+            "object.translate",
+            "object.rotate",
+            "object.scale",
+            "object.bulk_transform",
+            "object.duplicate",
+            "material.create",
+            "material.assign",
+            "material.set_color",
+            "material.set_texture",
+        }
+    )
 
-    def _submit_request(self, request: dict) -> dict:
-        queued = {"request": request, "event": threading.Event(), "response": None}
-        self._request_queue.put(queued)
-        queued["event"].wait()
-        return queued["response"]
+    def _enqueue_request(self, request: dict) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._request_queue.put((request, future))
+        return future
 
     def _drain_request_queue(self):
-        while True:
+        # The UI and undo system may have changed data since the last tick
+        self._handler.reset_caches()
+        for _ in range(MAX_REQUESTS_PER_TICK):
             try:
-                queued = self._request_queue.get_nowait()
+                request, future = self._request_queue.get_nowait()
             except queue.Empty:
                 break
-            queued["response"] = self._process_request(queued["request"])
-            queued["event"].set()
+            # Skip requests whose client has already gone away
+            if future.set_running_or_notify_cancel():
+                future.set_result(self._process_request(request))
+        else:
+            # Backlog left over: yield to the UI, then come straight back
+            return 0.0 if self._running else None
         return 0.01 if self._running else None
 
+    @classmethod
+    def _batch_mutates(cls, params: dict) -> bool:
+        commands = params.get("commands") if isinstance(params, dict) else None
+        if not isinstance(commands, list):
+            return False
+        return any(isinstance(item, dict) and item.get("command") in cls.MUTATION_COMMANDS for item in commands)
+
     @staticmethod
     def _maybe_push_undo(command: str):
         undo_push = bpy.ops.ed.undo_push
         poll = getattr(undo_push, "poll", None)
         if callable(poll) and not poll():
-            logger.debug(f"Skipping undo push for {command}: context poll failed")
+            logger.debug("Skipping undo push for %s: context poll failed", command)
             return
         undo_push(message=f"MCP: {command}")
 
@@ -1244,14 +1825,18 @@ class BlenderMCPServer:
         req_id = request.get("id")
         command = request.get("command", "")
         params = request.get("params", {})
+        if type(command) is str:
+            command = sys.intern(command)
         try:
-            # Auto-push undo before mutations
-            if command in self.MUTATION_COMMANDS:
+            # Auto-push undo before mutations; a batch gets one undo step for all of its items
+            if command in self.MUTATION_COMMANDS or (command == "batch" and self._batch_mutates(params)):
                 self._maybe_push_undo(command)
             result = self._handler.handle(command, params)
             return {"id": req_id, "success": True, "result": result}
         except Exception as e:
-            logger.error(f"Command '{command}' failed: {e}\n{traceback.format_exc()}")
+            logger.error("Command '%s' failed: %s", command, e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Traceback:\n%s", traceback.format_exc())
             return {"id": req_id, "success": False, "error": str(e)}
 
 
@@ -1264,7 +1849,7 @@ def _server_healthy() -> bool:
     return bool(
         _server
         and _server._running
-        and _server._server_socket is not None
+        and _server._server is not None
         and _server._thread is not None
         and _server._thread.is_alive()
     )
@@ -1285,11 +1870,21 @@ def _ensure_server_running():
     return None
 
 
+def _on_safe_mode_update(_prefs, _context):
+    _sync_runtime_settings()
+
+
 @persistent
 def _on_load_post(_dummy):
     bpy.app.timers.register(_ensure_server_running, first_interval=0.1)
 
 
+def _scene_change_handlers() -> tuple:
+    """Handler lists after which cached query results may be stale: data edits, frame changes, file loads."""
+    handlers = bpy.app.handlers
+    return (handlers.depsgraph_update_post, handlers.frame_change_post, handlers.load_post)
+
+
 class MCP_AddonPreferences(bpy.types.AddonPreferences):
     bl_idname = __name__
 
@@ -1297,6 +1892,7 @@ class MCP_AddonPreferences(bpy.types.AddonPreferences):
         name="Safe Mode",
         description="Restrict file access to project directory and enable tool whitelist",
         default=False,
+        update=_on_safe_mode_update,
     )
     port: bpy.props.IntProperty(
         name="Port",
@@ -1337,7 +1933,7 @@ class MCP_PT_Panel(bpy.types.Panel):
         layout = self.layout
         global _server
         if _server and _server._running:
-            layout.label(text=f"● Listening on {_server._host}:{_server._port}", icon="LINKED")
+            layout.label(text=f"● Listening on {_server.address}", icon="LINKED")
             layout.operator("mcp.stop_server", text="Stop Server")
         else:
             layout.label(text="○ Server stopped", icon="UNLINKED")
@@ -1367,7 +1963,7 @@ class MCP_OT_StartServer(bpy.types.Operator):
         if _server is None:
             _server = BlenderMCPServer()
         _server.start()
-        self.report({"INFO"}, f"MCP Bridge started on {_server._host}:{_server._port}")
+        self.report({"INFO"}, f"MCP Bridge started on {_server.address}")
         return {"FINISHED"}
 
 
@@ -1391,6 +1987,9 @@ def register():
         bpy.utils.register_class(cls)
     if _on_load_post not in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.append(_on_load_post)
+    for handlers in _scene_change_handlers():
+        if _on_scene_changed not in handlers:
+            handlers.append(_on_scene_changed)
     _ensure_server_running()
 
 
@@ -1398,6 +1997,9 @@ def unregister():
     global _server
     if _on_load_post in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(_on_load_post)
+    for handlers in _scene_change_handlers():
+        if _on_scene_changed in handlers:
+            handlers.remove(_on_scene_changed)
     if _server:
         _server.stop()
         _server = None
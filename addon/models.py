@@ -61,6 +61,18 @@ class ObjectScaleParams(BaseModel):
     )
 
 
+class ObjectTransformItem(BaseModel):
+    name: str
+    location: list[float] | None = Field(None, description="Absolute position [x, y, z]", min_length=3, max_length=3)
+    rotation: list[float] | None = Field(None, description="Euler angles [x, y, z]", min_length=3, max_length=3)
+    scale: list[float] | None = Field(None, description="Scale [x, y, z]", min_length=3, max_length=3)
+
+
+class ObjectBulkTransformParams(BaseModel):
+    items: list[ObjectTransformItem] = Field(..., min_length=1, description="Per-object transforms to apply")
+    degrees: bool = Field(True, description="Interpret rotations as degrees (True) or radians (False)")
+
+
 class ObjectDuplicateParams(BaseModel):
     name: str
     new_name: str | None = Field(None, description="Name for the copy")
@@ -97,6 +109,7 @@ class RenderStillParams(BaseModel):
     resolution_x: int | None = Field(None, gt=0)
     resolution_y: int | None = Field(None, gt=0)
     engine: str | None = Field(None, description="Render engine name (e.g. CYCLES, BLENDER_EEVEE)")
+    background: bool = Field(False, description="Render a snapshot in a separate Blender process as a job")
 
 
 class RenderAnimationParams(BaseModel):
@@ -104,12 +117,25 @@ class RenderAnimationParams(BaseModel):
     frame_start: int | None = None
     frame_end: int | None = None
     engine: str | None = None
+    background: bool = Field(False, description="Render a snapshot in a separate Blender process as a job")
 
 
 class ExportFileParams(BaseModel):
     filepath: str
 
 
+# ── Batching ───────────────────────────────────────────────────────
+
+
+class BatchCommand(BaseModel):
+    command: str
+    params: dict = Field(default_factory=dict)
+
+
+class BatchParams(BaseModel):
+    commands: list[BatchCommand] = Field(..., min_length=1, description="Commands to run in order")
+
+
 # ── Python execution ───────────────────────────────────────────────
 
 
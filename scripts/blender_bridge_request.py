@@ -10,6 +10,9 @@ import sys
 import uuid
 from typing import Any
 
+FRAME_HEADER_SIZE = 4
+MAX_FRAME_SIZE = 64 * 1024 * 1024  # Matches the add-on's request size limit
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Send a JSON command to the Blender add-on bridge on localhost.")
@@ -28,6 +31,28 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _recv_exactly(sock: socket.socket, view: memoryview) -> None:
+    """Fill ``view`` from the socket, receiving straight into it."""
+    filled = 0
+    while filled < len(view):
+        received = sock.recv_into(view[filled:])
+        if not received:
+            raise ConnectionError("Connection closed before a full response arrived")
+        filled += received
+
+
+def read_frame(sock: socket.socket) -> bytearray:
+    """Read one length-prefixed frame: a 4-byte big-endian length, then that many payload bytes."""
+    header = bytearray(FRAME_HEADER_SIZE)
+    _recv_exactly(sock, memoryview(header))
+    size = int.from_bytes(header, "big")
+    if size > MAX_FRAME_SIZE:
+        raise ConnectionError(f"Response frame of {size} bytes exceeds the {MAX_FRAME_SIZE} byte limit")
+    payload = bytearray(size)
+    _recv_exactly(sock, memoryview(payload))
+    return payload
+
+
 def send_request(host: str, port: int, command: str, params: dict[str, Any], timeout: float) -> dict[str, Any]:
     request = {
         "id": str(uuid.uuid4()),
@@ -35,15 +60,9 @@ def send_request(host: str, port: int, command: str, params: dict[str, Any], tim
         "params": params,
     }
     with socket.create_connection((host, port), timeout=timeout) as sock:
-        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
-        buffer = b""
-        while b"\n" not in buffer:
-            chunk = sock.recv(65536)
-            if not chunk:
-                raise ConnectionError("Connection closed before a full response arrived")
-            buffer += chunk
-    line = buffer.split(b"\n", 1)[0]
-    return json.loads(line.decode("utf-8"))
+        payload = json.dumps(request).encode("utf-8")
+        sock.sendall(len(payload).to_bytes(FRAME_HEADER_SIZE, "big") + payload)
+        return json.loads(read_frame(sock))
 
 
 def main() -> int:
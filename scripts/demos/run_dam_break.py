@@ -34,6 +34,8 @@ from typing import Any
 BRIDGE_HOST = "127.0.0.1"
 BRIDGE_PORT = 9876
 TIMEOUT = 30.0
+FRAME_HEADER_SIZE = 4
+MAX_RESPONSE_SIZE = 64 * 1024 * 1024
 
 
 # ---------------------------------------------------------------------------
@@ -41,6 +43,16 @@ TIMEOUT = 30.0
 # ---------------------------------------------------------------------------
 
 
+def _recv_into(sock: socket.socket, buffer: bytearray) -> bytearray:
+    view = memoryview(buffer)
+    while view:
+        received = sock.recv_into(view)
+        if not received:
+            raise ConnectionError("Connection closed before response")
+        view = view[received:]
+    return buffer
+
+
 def send_command(
     command: str,
     params: dict[str, Any],
@@ -52,14 +64,12 @@ def send_command(
     """Send a single command to the Blender bridge and return the response."""
     request = {"id": str(uuid.uuid4()), "command": command, "params": params}
     with socket.create_connection((host, port), timeout=timeout) as sock:
-        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
-        buf = b""
-        while b"\n" not in buf:
-            chunk = sock.recv(65536)
-            if not chunk:
-                raise ConnectionError("Connection closed before response")
-            buf += chunk
-    return json.loads(buf.split(b"\n", 1)[0].decode("utf-8"))
+        payload = json.dumps(request).encode("utf-8")
+        sock.sendall(len(payload).to_bytes(FRAME_HEADER_SIZE, "big") + payload)
+        size = int.from_bytes(_recv_into(sock, bytearray(FRAME_HEADER_SIZE)), "big")
+        if size > MAX_RESPONSE_SIZE:
+            raise ConnectionError(f"Response frame of {size} bytes exceeds the {MAX_RESPONSE_SIZE} byte limit")
+        return json.loads(_recv_into(sock, bytearray(size)))
 
 
 def exec_inline(code: str, args: dict | None = None, **kw: Any) -> dict:
@@ -1,77 +1,274 @@
 """Blender MCP Server — External MCP server that bridges Claude Desktop to Blender."""
 
 import asyncio
+import functools
+import itertools
 import json
 import logging
-import uuid
+import os
+import socket
+from collections.abc import AsyncIterator, Iterable
 from contextlib import asynccontextmanager
 from typing import Any
 
 from mcp.server.fastmcp import Context, FastMCP
 
+try:
+    import orjson
+except ImportError:  # Optional; install the "fast" extra for it
+    orjson = None  # type: ignore[assignment]
+
 from blender_mcp_server.headless import HeadlessBlenderExecutor, HeadlessJobManager
 
 logger = logging.getLogger(__name__)
 
 BLENDER_HOST = "127.0.0.1"
 BLENDER_PORT = 9876
+# BLENDER_MCP_TRANSPORT=unix must match the add-on's environment; the socket then skips the TCP stack.
+# Setting BLENDER_MCP_SOCKET picks the socket path and implies the unix transport.
+BLENDER_TRANSPORT = os.environ.get(
+    "BLENDER_MCP_TRANSPORT", "unix" if os.environ.get("BLENDER_MCP_SOCKET") else "tcp"
+).lower()
+BLENDER_SOCKET_PATH = os.environ.get("BLENDER_MCP_SOCKET") or (
+    f"/tmp/blender-mcp-{os.getuid()}.sock" if hasattr(os, "getuid") else ""
+)
+FRAME_HEADER_SIZE = 4  # Each message is a big-endian payload length followed by that many bytes of JSON
+MAX_FRAME_SIZE = 64 * 1024 * 1024  # Largest response accepted; matches the add-on's MAX_MESSAGE_SIZE
 HEADLESS_JOB_MANAGER = HeadlessJobManager()
+_NO_PARAMS: dict[str, Any] = {}  # Shared, never mutated
+
+
+def _json_dumps(value: Any) -> bytes:
+    """Encode compact JSON bytes, through orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            pass  # e.g. non-string keys or integers wider than 64 bits; the stdlib encoder handles them
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+@functools.lru_cache(maxsize=256)
+def _encoded_command(command: str) -> bytes:
+    """The ``"command":...,"params":`` middle of a request frame; command names are a small fixed set."""
+    return b',"command":' + _json_dumps(command) + b',"params":'
+
+
+@functools.lru_cache(maxsize=256)
+def _zero_arg_tail(command: str) -> bytes:
+    """Everything after the id for a call without params, e.g. ``scene.get_info``."""
+    return _encoded_command(command) + b"{}}"
+
+
+def _encode_request(request_id: int, command: str, params: dict) -> bytes:
+    """Build a request frame's JSON from constant pieces, serialising only the params."""
+    if not params:
+        return b'{"id":' + str(request_id).encode() + _zero_arg_tail(command)
+    return b"".join((b'{"id":', str(request_id).encode(), _encoded_command(command), _json_dumps(params), b"}"))
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes; orjson errors subclass json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class BlenderConnection:
-    """Async TCP client that communicates with the Blender add-on."""
+    """Async client that communicates with the Blender add-on over TCP or a Unix socket.
+
+    Requests are multiplexed over one connection: ``send_command`` only holds
+    the lock while writing its frame, and a background reader task routes each
+    response to the caller waiting on its ``id``.
+    """
+
+    max_batch = 256  # Calls per batch request in send_batch; longer lists are split
 
-    def __init__(self, host: str = BLENDER_HOST, port: int = BLENDER_PORT):
+    def __init__(self, host: str = BLENDER_HOST, port: int = BLENDER_PORT, path: str | None = None):
         self.host = host
         self.port = port
+        self.path = path  # Unix socket path; None follows BLENDER_MCP_TRANSPORT
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
-        self._lock = asyncio.Lock()
+        self._reader_task: asyncio.Task | None = None
+        self._reading: asyncio.StreamReader | None = None  # The stream _reader_task is bound to
+        self._pending: dict[int, asyncio.Future] = {}
+        self._lock = asyncio.Lock()  # Serialises frame writes only
+        self._connect_lock = asyncio.Lock()  # Concurrent first calls share one connect()
+        self._next_id = 0  # Ids only need to be unique per connection
 
     async def connect(self):
-        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        path = self.path or (BLENDER_SOCKET_PATH if BLENDER_TRANSPORT == "unix" else None)
+        if path:
+            self._reader, self._writer = await asyncio.open_unix_connection(path, limit=MAX_FRAME_SIZE)
+            self._start_reader()
+            logger.info(f"Connected to Blender at {path}")
+            return
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port, limit=MAX_FRAME_SIZE)
+        sock = self._writer.get_extra_info("socket")
+        if sock is not None:
+            # Requests are small and answered one at a time; don't let Nagle hold them back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # The connection is kept for the whole session; notice a Blender that vanished without closing it
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self._start_reader()
         logger.info(f"Connected to Blender at {self.host}:{self.port}")
 
     async def disconnect(self):
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+            self._reading = None
+        self._fail_pending(ConnectionError("Blender connection closed"))
         if self._writer:
             self._writer.close()
             await self._writer.wait_closed()
             self._writer = None
             self._reader = None
 
+    async def _ensure_connected(self):
+        if self._writer is None:
+            async with self._connect_lock:
+                if self._writer is None:
+                    await self.connect()
+        self._start_reader()
+
+    def _start_reader(self):
+        """Make sure a reader task is consuming the current stream, replacing one bound to an old stream."""
+        if self._reader is self._reading and self._reader_task is not None and not self._reader_task.done():
+            return
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+        self._reading = self._reader
+        self._reader_task = asyncio.create_task(self._read_responses(self._reader))
+
+    def _fail_pending(self, exc: Exception):
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exc)
+
+    def _reset(self, exc: Exception):
+        """Drop the connection after an I/O failure; the next command reconnects."""
+        if self._writer:
+            self._writer.close()
+        self._writer = None
+        self._reader = None
+        self._fail_pending(exc)
+
+    async def _read_responses(self, reader: asyncio.StreamReader | None):
+        assert reader is not None
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(FRAME_HEADER_SIZE)
+                    size = int.from_bytes(header, "big")
+                    if size > MAX_FRAME_SIZE:
+                        # A corrupt or hostile header; don't try to buffer it, drop the stream instead
+                        raise ConnectionError(f"{size}-byte frame exceeds the {MAX_FRAME_SIZE}-byte limit")
+                    body = await reader.readexactly(size)
+                except asyncio.IncompleteReadError as e:
+                    raise ConnectionError("Blender connection closed") from e
+                response = _json_loads(body)
+                future = self._pending.pop(response.get("id"), None)
+                if future is None:
+                    logger.warning("Dropping Blender response for unknown request id %r", response.get("id"))
+                elif not future.done():
+                    future.set_result(response)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if reader is self._reader:
+                self._reset(ConnectionError(f"Lost connection to Blender: {e}"))
+
     async def send_command(self, command: str, params: dict | None = None) -> Any:
         """Send a command to Blender and return the result."""
-        if not self._writer:
-            await self.connect()
-
-        assert self._reader is not None
-        assert self._writer is not None
-
-        request = {
-            "id": str(uuid.uuid4()),
-            "command": command,
-            "params": params or {},
-        }
+        await self._ensure_connected()
 
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
         async with self._lock:
+            writer = self._writer
+            if writer is None:
+                # Another call's I/O failure reset the connection while this one waited for the lock
+                raise ConnectionError("Lost connection to Blender")
+            self._next_id += 1
+            request_id = self._next_id
+            # Registered before writing so the reader can never see the response first
+            self._pending[request_id] = future
             try:
-                self._writer.write(json.dumps(request).encode() + b"\n")
-                await self._writer.drain()
-
-                line = await self._reader.readline()
-                if not line:
-                    raise ConnectionError("Blender connection closed")
-
-                response = json.loads(line)
-                if not response.get("success"):
-                    raise RuntimeError(response.get("error", "Unknown error from Blender"))
-                return response.get("result")
+                payload = _encode_request(request_id, command, params or _NO_PARAMS)
+                writer.writelines((len(payload).to_bytes(FRAME_HEADER_SIZE, "big"), payload))
+                await writer.drain()
             except (ConnectionError, OSError) as e:
                 # Connection lost — reset and re-raise
-                self._writer = None
-                self._reader = None
+                self._pending.pop(request_id, None)
+                self._reset(ConnectionError(f"Lost connection to Blender: {e}"))
                 raise ConnectionError(f"Lost connection to Blender: {e}") from e
 
+        try:
+            response = await future
+        finally:
+            self._pending.pop(request_id, None)
+        if not response.get("success"):
+            raise RuntimeError(response.get("error", "Unknown error from Blender"))
+        return response.get("result")
+
+    async def send_many(self, calls: Iterable[tuple[str, dict | None]]) -> list[Any]:
+        """Pipeline ``(command, params)`` pairs as separate requests and return their results in order.
+
+        Unlike ``send_batch`` each call is its own request and undo step, and the
+        first failure is raised.
+        """
+        return await asyncio.gather(*(self.send_command(command, params) for command, params in calls))
+
+    async def send_batch(self, calls: Iterable[tuple[str, dict | None]]) -> list[dict]:
+        """Run ``(command, params)`` pairs through the add-on's ``batch`` command.
+
+        Returns one ``{"success": ..., "result" | "error": ...}`` entry per call, in
+        order; a failing call does not stop the others. Lists longer than
+        ``max_batch`` are split into several batch requests pipelined on the
+        connection, each with its own undo step.
+        """
+        return [entry async for entry in self.iter_batch(calls)]
+
+    async def iter_batch(self, calls: Iterable[tuple[str, dict | None]]) -> AsyncIterator[dict]:
+        """Like ``send_batch``, but yield each batch request's entries as soon as its reply arrives."""
+        items = [{"command": command, "params": params or _NO_PARAMS} for command, params in calls]
+        # All requests are written up front; replies are consumed and released one batch at a time
+        tasks = [
+            asyncio.ensure_future(self.send_command("batch", {"commands": items[start : start + self.max_batch]}))
+            for start in range(0, len(items), self.max_batch)
+        ]
+        try:
+            for task in tasks:
+                reply = await task
+                for entry in reply["results"]:
+                    yield entry
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+class BlenderConnectionPool:
+    """Round-robin over several ``BlenderConnection``s, each connecting on first use.
+
+    One multiplexed connection already carries concurrent calls; a pool only
+    helps when many clients push large frames at once and one socket buffer
+    becomes the bottleneck.
+    """
+
+    def __init__(self, size: int = 4, host: str = BLENDER_HOST, port: int = BLENDER_PORT, path: str | None = None):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self._connections = [BlenderConnection(host, port, path) for _ in range(size)]
+        self._next = itertools.cycle(self._connections)
+
+    async def send_command(self, command: str, params: dict | None = None) -> Any:
+        return await next(self._next).send_command(command, params)
+
+    async def disconnect(self):
+        await asyncio.gather(*(conn.disconnect() for conn in self._connections))
+
 
 @asynccontextmanager
 async def blender_lifespan(server: FastMCP):
@@ -92,6 +289,11 @@ mcp = FastMCP(
 )
 
 
+def _to_json(result: Any) -> str:
+    """Serialize a tool result compactly; whitespace only costs the model tokens."""
+    return _json_dumps(result).decode()
+
+
 def _get_conn(ctx: Context) -> BlenderConnection:
     return ctx.request_context.lifespan_context  # type: ignore[no-any-return]
 
@@ -105,7 +307,7 @@ def _get_conn(ctx: Context) -> BlenderConnection:
 )
 async def scene_get_info(ctx: Context) -> str:
     result = await _get_conn(ctx).send_command("scene.get_info")
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -117,7 +319,7 @@ async def scene_list_objects(ctx: Context, type: str | None = None) -> str:
     if type:
         params["type"] = type
     result = await _get_conn(ctx).send_command("scene.list_objects", params)
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -126,7 +328,7 @@ async def scene_list_objects(ctx: Context, type: str | None = None) -> str:
 )
 async def object_get_transform(ctx: Context, name: str) -> str:
     result = await _get_conn(ctx).send_command("object.get_transform", {"name": name})
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -138,7 +340,7 @@ async def object_get_hierarchy(ctx: Context, name: str | None = None) -> str:
     if name:
         params["name"] = name
     result = await _get_conn(ctx).send_command("object.get_hierarchy", params)
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -147,7 +349,7 @@ async def object_get_hierarchy(ctx: Context, name: str | None = None) -> str:
 )
 async def material_list(ctx: Context) -> str:
     result = await _get_conn(ctx).send_command("material.list")
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 # -- Object mutation tools --
@@ -170,7 +372,7 @@ async def object_create(
     if location:
         params["location"] = location
     result = await _get_conn(ctx).send_command("object.create_mesh", params)
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -179,7 +381,7 @@ async def object_create(
 )
 async def object_delete(ctx: Context, name: str) -> str:
     result = await _get_conn(ctx).send_command("object.delete", {"name": name})
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -198,7 +400,7 @@ async def object_translate(
     if offset:
         params["offset"] = offset
     result = await _get_conn(ctx).send_command("object.translate", params)
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -214,7 +416,7 @@ async def object_rotate(
     result = await _get_conn(ctx).send_command(
         "object.rotate", {"name": name, "rotation": rotation, "degrees": degrees}
     )
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -223,7 +425,20 @@ async def object_rotate(
 )
 async def object_scale(ctx: Context, name: str, scale: list[float]) -> str:
     result = await _get_conn(ctx).send_command("object.scale", {"name": name, "scale": scale})
-    return json.dumps(result, indent=2)
+    return _to_json(result)
+
+
+@mcp.tool(
+    name="blender_object_bulk_transform",
+    description=(
+        "Apply location, rotation, and/or scale to many objects in one request and one undo step. "
+        'Each item is {"name": str, "location"?: [x, y, z], "rotation"?: [x, y, z], "scale"?: [x, y, z]}. '
+        "Rotations are in degrees unless degrees is false. Missing objects are reported, not fatal."
+    ),
+)
+async def object_bulk_transform(ctx: Context, items: list[dict[str, Any]], degrees: bool = True) -> str:
+    result = await _get_conn(ctx).send_command("object.bulk_transform", {"items": items, "degrees": degrees})
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -235,7 +450,7 @@ async def object_duplicate(ctx: Context, name: str, new_name: str | None = None)
     if new_name:
         params["new_name"] = new_name
     result = await _get_conn(ctx).send_command("object.duplicate", params)
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 # -- Material tools --
@@ -250,7 +465,7 @@ async def material_create(ctx: Context, name: str = "Material", color: list[floa
     if color:
         params["color"] = color
     result = await _get_conn(ctx).send_command("material.create", params)
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -259,7 +474,7 @@ async def material_create(ctx: Context, name: str = "Material", color: list[floa
 )
 async def material_assign(ctx: Context, object: str, material: str) -> str:
     result = await _get_conn(ctx).send_command("material.assign", {"object": object, "material": material})
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -268,7 +483,7 @@ async def material_assign(ctx: Context, object: str, material: str) -> str:
 )
 async def material_set_color(ctx: Context, name: str, color: list[float]) -> str:
     result = await _get_conn(ctx).send_command("material.set_color", {"name": name, "color": color})
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -277,7 +492,7 @@ async def material_set_color(ctx: Context, name: str, color: list[float]) -> str
 )
 async def material_set_texture(ctx: Context, name: str, filepath: str) -> str:
     result = await _get_conn(ctx).send_command("material.set_texture", {"name": name, "filepath": filepath})
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 # -- Render tools --
@@ -288,7 +503,9 @@ async def material_set_texture(ctx: Context, name: str, filepath: str) -> str:
     description=(
         "Render the current scene as a still image. Optionally set output path, resolution, and render engine "
         "(BLENDER_EEVEE, CYCLES, etc.). Use transport='bridge' for the live Blender add-on session, or "
-        "transport='headless' with blend_file='/path/to/file.blend' to render in a separate background Blender process."
+        "transport='headless' with blend_file='/path/to/file.blend' to render in a separate background Blender process. "
+        "With transport='bridge', background=True renders a snapshot of the live session in a child Blender process "
+        "and returns a job_id to poll with blender_job_status."
     ),
 )
 async def render_still(
@@ -300,6 +517,7 @@ async def render_still(
     transport: str = "bridge",
     blend_file: str | None = None,
     factory_startup: bool | None = None,
+    background: bool = False,
 ) -> str:
     if transport == "headless":
         code = """
@@ -340,8 +558,10 @@ __result__ = {
             params["resolution_y"] = resolution_y
         if engine:
             params["engine"] = engine
+        if background:
+            params["background"] = True
         result = await _get_conn(ctx).send_command("render.still", params)
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -349,7 +569,8 @@ __result__ = {
     description=(
         "Render an animation. Optionally set output path, frame range, and render engine. "
         "Use transport='bridge' for the live Blender add-on session, or transport='headless' with a blend_file "
-        "to render in a separate background Blender process."
+        "to render in a separate background Blender process. With transport='bridge', background=True renders a "
+        "snapshot of the live session in a child Blender process and returns a job_id to poll with blender_job_status."
     ),
 )
 async def render_animation(
@@ -361,6 +582,7 @@ async def render_animation(
     transport: str = "bridge",
     blend_file: str | None = None,
     factory_startup: bool | None = None,
+    background: bool = False,
 ) -> str:
     if transport == "headless":
         code = """
@@ -401,8 +623,10 @@ __result__ = {
             params["frame_end"] = frame_end
         if engine:
             params["engine"] = engine
+        if background:
+            params["background"] = True
         result = await _get_conn(ctx).send_command("render.animation", params)
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 # -- Export tools --
@@ -414,7 +638,7 @@ __result__ = {
 )
 async def export_gltf(ctx: Context, filepath: str) -> str:
     result = await _get_conn(ctx).send_command("export.gltf", {"filepath": filepath})
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -423,7 +647,7 @@ async def export_gltf(ctx: Context, filepath: str) -> str:
 )
 async def export_obj(ctx: Context, filepath: str) -> str:
     result = await _get_conn(ctx).send_command("export.obj", {"filepath": filepath})
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -432,7 +656,7 @@ async def export_obj(ctx: Context, filepath: str) -> str:
 )
 async def export_fbx(ctx: Context, filepath: str) -> str:
     result = await _get_conn(ctx).send_command("export.fbx", {"filepath": filepath})
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 # -- History tools --
@@ -444,7 +668,7 @@ async def export_fbx(ctx: Context, filepath: str) -> str:
 )
 async def history_undo(ctx: Context) -> str:
     result = await _get_conn(ctx).send_command("history.undo")
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -453,7 +677,25 @@ async def history_undo(ctx: Context) -> str:
 )
 async def history_redo(ctx: Context) -> str:
     result = await _get_conn(ctx).send_command("history.redo")
-    return json.dumps(result, indent=2)
+    return _to_json(result)
+
+
+# -- Batch tools --
+
+
+@mcp.tool(
+    name="blender_batch",
+    description=(
+        "Run several bridge commands in one round trip, in order. Each item is "
+        '{"command": "object.get_transform", "params": {"name": "Cube"}} using the add-on command names '
+        "(scene.*, object.*, material.*, render.*, export.*, history.*, python.*, job.*). "
+        "Returns one {success, result | error} entry per item; a failing item does not stop the rest. "
+        "Mutating items share a single undo step."
+    ),
+)
+async def batch(ctx: Context, commands: list[dict[str, Any]]) -> str:
+    result = await _get_conn(ctx).send_command("batch", {"commands": commands})
+    return _to_json(result)
 
 
 # -- Python execution tools --
@@ -502,7 +744,7 @@ async def python_exec(
         if timeout_seconds is not None:
             params["timeout_seconds"] = timeout_seconds
         result = await _get_conn(ctx).send_command("python.execute", params)
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -549,7 +791,7 @@ async def python_exec_async(
         if timeout_seconds is not None:
             params["timeout_seconds"] = timeout_seconds
         result = await _get_conn(ctx).send_command("python.execute_async", params)
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -565,7 +807,7 @@ async def job_status(ctx: Context, job_id: str) -> str:
         result = HEADLESS_JOB_MANAGER.get_status(job_id)
     else:
         result = await _get_conn(ctx).send_command("job.status", {"job_id": job_id})
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -580,7 +822,7 @@ async def job_cancel(ctx: Context, job_id: str) -> str:
         result = await HEADLESS_JOB_MANAGER.cancel(job_id)
     else:
         result = await _get_conn(ctx).send_command("job.cancel", {"job_id": job_id})
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool(
@@ -595,7 +837,7 @@ async def job_list(ctx: Context) -> str:
     except Exception:
         bridge_jobs = []
     result = {"jobs": bridge_jobs + headless_jobs}
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 def main():
@@ -1,9 +1,14 @@
 """Tests for the Blender add-on command handler using mocked bpy."""
 
+import json
+import logging
+import math
 import os
+import socket
 import sys
 import tempfile
 import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -111,14 +116,79 @@ def handler(addon_module):
     return addon_module.CommandHandler()
 
 
+@pytest.fixture
+def running_server(addon_module):
+    """Start the bridge on an ephemeral port and stop it after the test."""
+    addon_module.PORT = 0
+    server = addon_module.BlenderMCPServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def _await_frame(server, sock, timeout=5.0):
+    """Like _await_response, for a length-prefixed frame; returns the raw payload."""
+    sock.settimeout(0.05)
+    data = b""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if len(data) >= 4 and len(data) - 4 >= int.from_bytes(data[:4], "big"):
+            return data[4:]
+        server._drain_request_queue()
+        try:
+            chunk = sock.recv(65536)
+        except TimeoutError:
+            continue
+        if not chunk:
+            break
+        data += chunk
+    raise AssertionError(f"Incomplete frame: {data!r}")
+
+
+def _await_response(server, sock, timeout=5.0):
+    """Drain the request queue (Blender's main-thread timer) until a full response line arrives."""
+    sock.settimeout(0.05)
+    data = b""
+    deadline = time.monotonic() + timeout
+    while not data.endswith(b"\n") and time.monotonic() < deadline:
+        server._drain_request_queue()
+        try:
+            chunk = sock.recv(65536)
+        except TimeoutError:
+            continue
+        if not chunk:
+            break
+        data += chunk
+    return json.loads(data)
+
+
 class TestSceneCommands:
     def test_scene_get_info(self, handler):
-        result = handler.handle("scene.get_info", {})
+        result = json.loads(handler.handle("scene.get_info", {}))
         assert result["name"] == "Scene"
         assert result["frame_current"] == 1
         assert result["render_engine"] == "BLENDER_EEVEE"
         assert result["object_count"] == 2
 
+    def test_scene_get_info_cached_until_scene_changes(self, handler, addon_module, mock_bpy):
+        first = handler.handle("scene.get_info", {})
+        assert type(first) is addon_module.RawJSON
+        mock_bpy.context.scene.frame_current = 7
+        assert handler.handle("scene.get_info", {}) is first  # Served without re-encoding
+
+        addon_module._bump_scene_version()
+        assert json.loads(handler.handle("scene.get_info", {}))["frame_current"] == 7
+
+    def test_mutating_command_invalidates_cached_queries(self, handler, mock_bpy):
+        mock_bpy.data.materials = []
+        assert json.loads(handler.handle("material.list", {}))["materials"] == []
+        handler.handle("object.translate", {"name": "Cube", "location": [1, 2, 3]})
+        mat = MagicMock(use_nodes=True, users=1)
+        mat.name = "Mat"
+        mock_bpy.data.materials = [mat]
+
+        assert len(json.loads(handler.handle("material.list", {}))["materials"]) == 1
+
     def test_scene_list_objects(self, handler):
         result = handler.handle("scene.list_objects", {})
         assert len(result["objects"]) == 2
@@ -127,9 +197,25 @@ class TestSceneCommands:
         assert "Camera" in names
 
     def test_scene_list_objects_type_filter(self, handler):
-        result = handler.handle("scene.list_objects", {"type": "MESH"})
+        result = handler.handle("scene.list_objects", {"type": "mesh"})
         assert len(result["objects"]) == 1
         assert result["objects"][0]["name"] == "Cube"
+        assert result["objects"][0]["type"] == "MESH"
+
+    def test_scene_list_objects_uses_foreach_get(self, handler, addon_module, mock_bpy):
+        np = pytest.importorskip("numpy")
+
+        class FakeCollection(list):
+            def foreach_get(self, attr, buffer):
+                assert attr == "location"
+                buffer[:] = np.arange(len(buffer), dtype=buffer.dtype)
+
+        cube, camera = mock_bpy.context.scene.objects
+        mock_bpy.context.scene.objects = FakeCollection([cube, camera])
+        with patch.object(addon_module, "np", np):
+            result = handler.handle("scene.list_objects", {})
+
+        assert [o["location"] for o in result["objects"]] == [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
 
 
 class TestObjectCommands:
@@ -147,6 +233,19 @@ class TestObjectCommands:
         with pytest.raises(ValueError, match="Unknown mesh type"):
             addon_module._build_primitive_pydata("bad-shape", 2.0)
 
+    def test_create_mesh_does_not_scan_existing_objects(self, handler, mock_bpy):
+        created = MagicMock()
+        created.name = "Ball"
+        created.type = "MESH"
+        created.location = [1.0, 2.0, 3.0]
+        mock_bpy.data.objects.new = MagicMock(return_value=created)
+        mock_bpy.data.objects.keys = MagicMock(side_effect=AssertionError("object creation must not scan the scene"))
+
+        result = handler.handle("object.create_mesh", {"type": "sphere", "name": "Ball", "location": [1, 2, 3]})
+
+        assert result == {"name": "Ball", "type": "MESH", "location": [1.0, 2.0, 3.0]}
+        mock_bpy.data.objects.new.assert_called_once()
+
     def test_get_transform(self, handler):
         result = handler.handle("object.get_transform", {"name": "Cube"})
         assert result["name"] == "Cube"
@@ -159,19 +258,158 @@ class TestObjectCommands:
             handler.handle("object.get_transform", {"name": "NonExistent"})
 
     def test_unknown_command(self, handler):
-        with pytest.raises(ValueError, match="Unknown command"):
+        with pytest.raises(ValueError, match="Unknown command") as excinfo:
             handler.handle("nonexistent.command", {})
+        assert excinfo.value.__suppress_context__
+
+    def test_handler_table_points_at_methods(self, addon_module):
+        for command, method_name in addon_module.CommandHandler._HANDLERS.items():
+            assert callable(getattr(addon_module.CommandHandler, method_name, None)), command
 
     def test_get_hierarchy_full_scene(self, handler):
         result = handler.handle("object.get_hierarchy", {})
         assert "roots" in result
         assert len(result["roots"]) == 2
 
+    def test_get_hierarchy_nested_children(self, handler, mock_bpy):
+        def node(name, children=()):
+            obj = MagicMock()
+            obj.name = name
+            obj.type = "EMPTY"
+            obj.children = list(children)
+            return obj
+
+        leaf_a, leaf_b = node("LeafA"), node("LeafB")
+        root = node("Root", [node("Mid", [leaf_a, leaf_b]), node("Other")])
+        mock_bpy.data.objects.get = lambda name: root if name == "Root" else None
+
+        tree = handler.handle("object.get_hierarchy", {"name": "Root"})
+
+        assert [c["name"] for c in tree["children"]] == ["Mid", "Other"]
+        assert [c["name"] for c in tree["children"][0]["children"]] == ["LeafA", "LeafB"]
+        assert tree["children"][1]["children"] == []
+
+    def test_get_hierarchy_full_scene_indexes_parents_once(self, handler, mock_bpy):
+        root = MagicMock(type="EMPTY")
+        root.name, root.parent = "Root", None
+        child = MagicMock(type="MESH")
+        child.name, child.parent = "Child", root
+        type(root).children = property(lambda self: pytest.fail("Object.children should not be scanned"))
+        mock_bpy.context.scene.objects = [child, root]
+
+        result = handler.handle("object.get_hierarchy", {})
+
+        assert result == {
+            "roots": [
+                {"name": "Root", "type": "EMPTY", "children": [{"name": "Child", "type": "MESH", "children": []}]}
+            ]
+        }
+
+    def test_object_lookup_is_memoised_until_delete(self, handler, mock_bpy):
+        lookups = []
+        cube = mock_bpy.data.objects.get("Cube")
+        mock_bpy.data.objects.get = lambda name: lookups.append(name) or {"Cube": cube}.get(name)
+
+        handler.handle("object.get_transform", {"name": "Cube"})
+        handler.handle("object.translate", {"name": "Cube", "offset": [1, 0, 0]})
+        assert lookups == ["Cube"]
+
+        handler.handle("object.delete", {"name": "Cube"})
+        assert handler._object_cache == {}
+
+
+class TestTransformCommands:
+    @pytest.fixture
+    def cube(self, mock_bpy):
+        cube = mock_bpy.data.objects.get("Cube")
+        cube.location, cube.rotation_euler, cube.scale = [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]
+        return cube
+
+    def test_translate_absolute_writes_in_place(self, handler, cube):
+        location = cube.location
+        result = handler.handle("object.translate", {"name": "Cube", "location": [1, 2, 3]})
+        assert cube.location is location
+        assert result["location"] == [1, 2, 3]
+
+    def test_translate_offset(self, handler, cube):
+        cube.location[:] = [1.0, 1.0, 1.0]
+        result = handler.handle("object.translate", {"name": "Cube", "offset": [1, 2, 3]})
+        assert result["location"] == [2.0, 3.0, 4.0]
+
+    def test_rotate_converts_degrees_in_place(self, handler, cube):
+        rotation = cube.rotation_euler
+        result = handler.handle("object.rotate", {"name": "Cube", "rotation": [180, 0, 90]})
+        assert cube.rotation_euler is rotation
+        assert result["rotation_euler"] == pytest.approx([math.pi, 0.0, math.pi / 2])
+
+    def test_scale_writes_in_place(self, handler, cube):
+        scale = cube.scale
+        result = handler.handle("object.scale", {"name": "Cube", "scale": [2, 2, 2]})
+        assert cube.scale is scale
+        assert result["scale"] == [2, 2, 2]
+
+    def test_bulk_transform_applies_items_and_reports_missing(self, handler, cube):
+        result = handler.handle(
+            "object.bulk_transform",
+            {
+                "items": [
+                    {"name": "Cube", "location": [1, 2, 3], "rotation": [90, 0, 0], "scale": [2, 2, 2]},
+                    {"name": "Ghost", "location": [0, 0, 0]},
+                ]
+            },
+        )
+
+        assert result == {"updated": ["Cube"], "missing": ["Ghost"]}
+        assert cube.location == [1, 2, 3]
+        assert cube.rotation_euler == pytest.approx([math.pi / 2, 0.0, 0.0])
+        assert cube.scale == [2, 2, 2]
+
+    def test_bulk_transform_pushes_single_undo(self, addon_module, mock_bpy):
+        mock_bpy.ops.ed.undo_push.poll.return_value = True
+        server = addon_module.BlenderMCPServer()
+        request = {
+            "id": "1",
+            "command": "object.bulk_transform",
+            "params": {"items": [{"name": "Cube", "location": [1, 1, 1]}, {"name": "Camera", "location": [2, 2, 2]}]},
+        }
+
+        assert server._process_request(request)["success"] is True
+        mock_bpy.ops.ed.undo_push.assert_called_once_with(message="MCP: object.bulk_transform")
+
 
 class TestMaterialCommands:
+    def test_material_assign_missing_material(self, handler):
+        with pytest.raises(ValueError, match="Material 'Missing' not found"):
+            handler.handle("material.assign", {"object": "Cube", "material": "Missing"})
+
+    def test_material_assign_missing_object(self, handler):
+        with pytest.raises(ValueError, match="Object 'Nope' not found"):
+            handler.handle("material.assign", {"object": "Nope", "material": "Missing"})
+
+    def test_bsdf_lookup_is_memoised_until_reset(self, handler):
+        mat = MagicMock()
+        mat.as_pointer.return_value = 0x1000
+
+        first = handler._get_bsdf(mat)
+        assert handler._get_bsdf(mat) is first
+        mat.node_tree.nodes.get.assert_called_once_with("Principled BSDF")
+
+        handler.reset_caches()
+        handler._get_bsdf(mat)
+        assert mat.node_tree.nodes.get.call_count == 2
+
+    def test_undo_clears_bsdf_cache(self, handler):
+        mat = MagicMock()
+        mat.as_pointer.return_value = 0x1000
+        handler._get_bsdf(mat)
+
+        handler.handle("history.undo", {})
+
+        assert handler._bsdf_cache == {}
+
     def test_material_list_empty(self, handler, mock_bpy):
         mock_bpy.data.materials = []
-        result = handler.handle("material.list", {})
+        result = json.loads(handler.handle("material.list", {}))
         assert result["materials"] == []
 
 
@@ -189,7 +427,7 @@ class TestServerExecution:
         assert result["success"] is True
         mock_bpy.ops.ed.undo_push.assert_not_called()
 
-    def test_submit_request_runs_through_queue(self, addon_module):
+    def test_enqueued_request_runs_through_queue(self, addon_module):
         server = addon_module.BlenderMCPServer()
         request = {"id": "abc", "command": "scene.get_info", "params": {}}
         expected = {"id": "abc", "success": True, "result": {"ok": True}}
@@ -197,15 +435,277 @@ class TestServerExecution:
 
         with patch.object(server, "_process_request", return_value=expected) as process:
             worker = threading.Thread(
-                target=lambda: response_holder.setdefault("response", server._submit_request(request))
+                target=lambda: response_holder.setdefault("response", server._enqueue_request(request).result()),
+                daemon=True,
             )
             worker.start()
-            server._drain_request_queue()
-            worker.join(timeout=1)
+            deadline = time.monotonic() + 1
+            while worker.is_alive() and time.monotonic() < deadline:
+                server._drain_request_queue()
+                worker.join(timeout=0.01)
 
         assert response_holder["response"] == expected
         process.assert_called_once_with(request)
 
+    def test_failed_command_skips_traceback_below_debug(self, addon_module):
+        server = addon_module.BlenderMCPServer()
+        request = {"id": "1", "command": "object.delete", "params": {"name": "Missing"}}
+
+        level = addon_module.logger.level
+        try:
+            with patch.object(addon_module.traceback, "format_exc") as format_exc:
+                addon_module.logger.setLevel(logging.INFO)
+                assert server._process_request(request)["success"] is False
+                format_exc.assert_not_called()
+
+                addon_module.logger.setLevel(logging.DEBUG)
+                assert server._process_request(request)["success"] is False
+                format_exc.assert_called_once()
+        finally:
+            addon_module.logger.setLevel(level)
+
+    def test_command_names_are_interned(self, addon_module):
+        server = addon_module.BlenderMCPServer()
+        command = "".join(["object.", "translate"])
+
+        with patch.object(addon_module.CommandHandler, "handle", return_value={}) as handle:
+            server._process_request({"id": "1", "command": command, "params": {}})
+
+        dispatched = handle.call_args.args[0]
+        assert dispatched is sys.intern(command)
+        assert any(key is dispatched for key in addon_module.CommandHandler._HANDLERS)
+        assert any(key is dispatched for key in server.MUTATION_COMMANDS)
+
+    def test_drain_caps_requests_per_tick(self, addon_module):
+        server = addon_module.BlenderMCPServer()
+        server._running = True
+        addon_module.MAX_REQUESTS_PER_TICK = 2
+        futures = [server._enqueue_request({"id": str(i), "command": "scene.get_info"}) for i in range(3)]
+
+        with patch.object(server, "_process_request", return_value={"success": True}):
+            assert server._drain_request_queue() == 0.0
+            assert [f.done() for f in futures] == [True, True, False]
+            assert server._drain_request_queue() == 0.01
+        assert futures[2].done()
+
+    def test_drain_timer_is_persistent(self, running_server, mock_bpy):
+        mock_bpy.app.timers.register.assert_any_call(
+            running_server._drain_request_queue, first_interval=0.01, persistent=True
+        )
+
+    def test_request_round_trip_over_tcp(self, running_server):
+        with socket.create_connection((running_server._host, running_server._port), timeout=5) as sock:
+            sock.sendall(b'{"id": "rt-1", "command": "scene.get_info", "params": {}}\n')
+            response = _await_response(running_server, sock)
+
+        assert response["id"] == "rt-1"
+        assert response["success"] is True
+        assert response["result"]["name"] == "Scene"
+
+    def test_streamed_response_round_trip_over_tcp(self, addon_module, running_server, mock_bpy):
+        addon_module.STREAM_MIN_ITEMS = 2
+        addon_module.STREAM_CHUNK_ITEMS = 1
+        materials = [MagicMock(use_nodes=True, users=i) for i in range(3)]
+        for i, mat in enumerate(materials):
+            mat.name = f"Mat{i}"
+        mock_bpy.data.materials = materials
+
+        with socket.create_connection((running_server._host, running_server._port), timeout=5) as sock:
+            sock.sendall(b'{"id": "s-1", "command": "material.list", "params": {}}\n')
+            response = _await_response(running_server, sock)
+
+        assert response["success"] is True
+        assert [m["user_count"] for m in response["result"]["materials"]] == [0, 1, 2]
+
+    def test_length_prefixed_round_trip_over_tcp(self, running_server):
+        payload = b'{"id": "lp-1", "command": "scene.get_info", "params": {}}'
+        with socket.create_connection((running_server._host, running_server._port), timeout=5) as sock:
+            sock.sendall(len(payload).to_bytes(4, "big") + payload)
+            data = _await_frame(running_server, sock)
+
+        response = json.loads(data)
+        assert response["id"] == "lp-1"
+        assert response["success"] is True
+
+    def test_length_prefixed_large_result_is_one_frame(self, addon_module, running_server, mock_bpy):
+        addon_module.STREAM_MIN_ITEMS = 2
+        materials = [MagicMock(use_nodes=True, users=i) for i in range(3)]
+        for i, mat in enumerate(materials):
+            mat.name = f"Mat{i}"
+        mock_bpy.data.materials = materials
+        payload = b'{"id": "lp-2", "command": "material.list", "params": {}}'
+
+        with (
+            patch.object(addon_module, "_iter_response_chunks") as iter_chunks,
+            socket.create_connection((running_server._host, running_server._port), timeout=5) as sock,
+        ):
+            sock.sendall(len(payload).to_bytes(4, "big") + payload)
+            response = json.loads(_await_frame(running_server, sock))
+            sock.settimeout(0.2)
+            with pytest.raises(TimeoutError):
+                sock.recv(1)  # Nothing follows the single frame
+
+        iter_chunks.assert_not_called()
+        assert [m["name"] for m in response["result"]["materials"]] == ["Mat0", "Mat1", "Mat2"]
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+    def test_unix_socket_transport_round_trip(self, addon_module):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "bridge.sock")
+            stale = socket.socket(socket.AF_UNIX)
+            stale.bind(path)  # Left behind with nobody listening, like after a crash
+            stale.close()
+            addon_module.TRANSPORT = "unix"
+            addon_module.SOCKET_PATH = path
+            server = addon_module.BlenderMCPServer()
+            server.start()
+            try:
+                assert server.address == path
+                payload = b'{"id": "ux-1", "command": "scene.get_info", "params": {}}'
+                with socket.socket(socket.AF_UNIX) as sock:
+                    sock.connect(path)
+                    sock.sendall(len(payload).to_bytes(4, "big") + payload)
+                    response = json.loads(_await_frame(server, sock))
+            finally:
+                server.stop()
+
+            assert response["id"] == "ux-1"
+            assert response["success"] is True
+            assert not os.path.exists(path)
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+    def test_unix_socket_path_holding_a_regular_file_is_left_alone(self, addon_module):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "notes.txt")
+            with open(path, "w") as f:
+                f.write("user data\n")
+            addon_module.TRANSPORT = "unix"
+            addon_module.SOCKET_PATH = path
+            server = addon_module.BlenderMCPServer()
+            server.start()
+            try:
+                assert not server._running
+            finally:
+                server.stop()
+
+            with open(path) as f:
+                assert f.read() == "user data\n"
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+    def test_stop_keeps_a_socket_rebound_by_another_instance(self, addon_module):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "bridge.sock")
+            addon_module.TRANSPORT = "unix"
+            addon_module.SOCKET_PATH = path
+            server = addon_module.BlenderMCPServer()
+            server.start()
+            os.unlink(path)
+            with socket.socket(socket.AF_UNIX) as successor:
+                successor.bind(path)  # A second Blender took the path over
+                successor.listen()
+                server.stop()
+
+                assert os.path.exists(path)
+
+    def test_pipelined_requests_share_one_drain_tick(self, running_server):
+        frames = b""
+        for i in range(3):
+            payload = json.dumps({"id": i, "command": "scene.get_info", "params": {}}).encode()
+            frames += len(payload).to_bytes(4, "big") + payload
+
+        with socket.create_connection((running_server._host, running_server._port), timeout=5) as sock:
+            sock.sendall(frames)
+            deadline = time.monotonic() + 5
+            while running_server._request_queue.qsize() < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            running_server._drain_request_queue()
+            sock.settimeout(5)
+            data = b""
+            ids = []
+            while len(ids) < 3:
+                data += sock.recv(65536)
+                while len(data) >= 4 and len(data) - 4 >= (size := int.from_bytes(data[:4], "big")):
+                    ids.append(json.loads(data[4 : 4 + size])["id"])
+                    data = data[4 + size :]
+
+        assert ids == [0, 1, 2]
+
+    def test_oversized_frame_drops_connection(self, addon_module, running_server):
+        with socket.create_connection((running_server._host, running_server._port), timeout=5) as sock:
+            sock.sendall((addon_module.MAX_MESSAGE_SIZE + 1).to_bytes(4, "big"))
+            assert sock.recv(1) == b""
+
+    def test_accepted_connections_disable_nagle(self, addon_module):
+        sock = MagicMock()
+
+        addon_module._configure_client_socket(sock)
+
+        sock.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        sock.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_SNDBUF, addon_module.SOCKET_BUFFER_SIZE)
+        sock.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_RCVBUF, addon_module.SOCKET_BUFFER_SIZE)
+
+    def test_connections_beyond_max_clients_are_refused(self, addon_module, running_server):
+        addon_module.MAX_CLIENTS = 1
+        with socket.create_connection((running_server._host, running_server._port), timeout=5) as first:
+            first.sendall(b'{"id": "a", "command": "scene.get_info", "params": {}}\n')
+            assert _await_response(running_server, first)["success"] is True
+            with socket.create_connection((running_server._host, running_server._port), timeout=5) as second:
+                assert second.recv(1) == b""
+
+    def test_invalid_json_returns_error_response(self, running_server):
+        with socket.create_connection((running_server._host, running_server._port), timeout=5) as sock:
+            sock.sendall(b"{not json\n")
+            response = _await_response(running_server, sock)
+
+        assert response["success"] is False
+        assert "Invalid JSON" in response["error"]
+
+    def test_non_object_request_returns_error_response(self, running_server):
+        with socket.create_connection((running_server._host, running_server._port), timeout=5) as sock:
+            sock.sendall(b'["scene.get_info"]\n')
+            response = _await_response(running_server, sock)
+            sock.sendall(b'{"id": 2, "command": "scene.get_info", "params": {}}\n')
+            followup = _await_response(running_server, sock)
+
+        assert response == {"id": None, "success": False, "error": "Request must be a JSON object"}
+        assert followup["success"] is True
+
+    def test_stop_wakes_idle_event_loop_promptly(self, addon_module):
+        addon_module.PORT = 0
+        server = addon_module.BlenderMCPServer()
+        server.start()
+        loop_thread = server._thread
+        with socket.create_connection((server._host, server._port), timeout=5):
+            started = time.monotonic()
+            server.stop()
+            elapsed = time.monotonic() - started
+
+        assert elapsed < 0.5
+        assert not loop_thread.is_alive()
+
+    def test_stop_with_connected_client_logs_no_errors(self, addon_module, caplog):
+        addon_module.PORT = 0
+        server = addon_module.BlenderMCPServer()
+        server.start()
+        with socket.create_connection((server._host, server._port), timeout=5) as sock:
+            sock.sendall(b"\x00\x00")  # Half a frame header, then idle like the persistent MCP connection
+            deadline = time.monotonic() + 5
+            while not server._clients and time.monotonic() < deadline:
+                time.sleep(0.01)
+            with caplog.at_level(logging.ERROR):
+                server.stop()
+
+        assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+
+    def test_stop_fails_pending_requests(self, addon_module):
+        server = addon_module.BlenderMCPServer()
+        future = server._enqueue_request({"id": "late", "command": "scene.get_info", "params": {}})
+
+        server.stop()
+
+        assert future.result(timeout=1) == {"id": "late", "success": False, "error": "Blender MCP Bridge stopped"}
+
     def test_python_execute_does_not_auto_push_undo(self, addon_module, mock_bpy):
         server = addon_module.BlenderMCPServer()
         request = {
@@ -220,6 +720,106 @@ class TestServerExecution:
         mock_bpy.ops.ed.undo_push.assert_not_called()
 
 
+class TestBatch:
+    def test_batch_runs_items_in_order_with_per_item_errors(self, handler):
+        result = handler.handle(
+            "batch",
+            {
+                "commands": [
+                    {"command": "object.get_transform", "params": {"name": "Cube"}},
+                    {"command": "object.get_transform", "params": {"name": "Missing"}},
+                    {"command": "scene.get_info"},
+                ]
+            },
+        )
+
+        outcomes = result["results"]
+        assert [r["success"] for r in outcomes] == [True, False, True]
+        assert outcomes[0]["result"]["name"] == "Cube"
+        assert "not found" in outcomes[1]["error"]
+        assert outcomes[2]["result"]["name"] == "Scene"
+
+    def test_nested_batch_rejected(self, handler):
+        result = handler.handle("batch", {"commands": [{"command": "batch", "params": {"commands": []}}]})
+        assert result["results"][0] == {"success": False, "error": "Nested batch commands are not supported"}
+
+    def test_mutating_batch_pushes_single_undo(self, addon_module, mock_bpy):
+        mock_bpy.ops.ed.undo_push.poll.return_value = True
+        server = addon_module.BlenderMCPServer()
+        request = {
+            "id": 1,
+            "command": "batch",
+            "params": {
+                "commands": [
+                    {"command": "object.scale", "params": {"name": "Cube", "scale": [2, 2, 2]}},
+                    {"command": "object.scale", "params": {"name": "Camera", "scale": [2, 2, 2]}},
+                ]
+            },
+        }
+
+        assert server._process_request(request)["success"] is True
+        mock_bpy.ops.ed.undo_push.assert_called_once_with(message="MCP: batch")
+
+    def test_read_only_batch_skips_undo(self, addon_module, mock_bpy):
+        mock_bpy.ops.ed.undo_push.poll.return_value = True
+        server = addon_module.BlenderMCPServer()
+        request = {"id": 1, "command": "batch", "params": {"commands": [{"command": "scene.get_info"}]}}
+
+        server._process_request(request)
+
+        mock_bpy.ops.ed.undo_push.assert_not_called()
+
+
+class TestWireEncoding:
+    def test_round_trip(self, addon_module):
+        message = {"id": "1", "success": True, "result": {"location": [0.0, 1.5, -2.0]}}
+        encoded = addon_module._json_dumps(message)
+        assert isinstance(encoded, bytes)
+        assert addon_module._json_loads(encoded) == message
+
+    def test_non_string_keys_are_stringified(self, addon_module):
+        assert addon_module._json_loads(addon_module._json_dumps({1: "a"})) == {"1": "a"}
+
+    def test_stdlib_fallback(self, addon_module):
+        with patch.object(addon_module, "orjson", None):
+            encoded = addon_module._json_dumps({"ok": True})
+            assert isinstance(encoded, bytes)
+            assert addon_module._json_loads(encoded) == {"ok": True}
+
+    def test_decode_error_is_json_decode_error(self, addon_module):
+        with pytest.raises(json.JSONDecodeError):
+            addon_module._json_loads(b"not json")
+
+    def test_large_result_lists_are_streamed(self, addon_module):
+        items = [{"name": f"Obj{i}", "location": [i, 0.5, -1.0]} for i in range(addon_module.STREAM_MIN_ITEMS + 10)]
+        response = {"id": "big", "success": True, "result": {"count": len(items), "objects": items}}
+
+        assert addon_module._should_stream(response)
+        chunks = list(addon_module._iter_response_chunks(response))
+
+        assert len(chunks) > 3
+        assert json.loads(b"".join(chunks)) == response
+
+    def test_small_and_failed_responses_are_not_streamed(self, addon_module):
+        assert not addon_module._should_stream({"id": "1", "success": True, "result": {"objects": [1, 2]}})
+        assert not addon_module._should_stream({"id": "1", "success": False, "error": "boom"})
+        assert not addon_module._should_stream({"id": "1", "success": True, "result": list(range(5000))})
+
+    def test_raw_json_result_is_spliced_not_reencoded(self, addon_module):
+        raw = addon_module.RawJSON(b'{"objects":[{"name":"Cube"}]}')
+        encoded = addon_module._encode_response({"id": 3, "success": True, "result": raw})
+
+        assert raw in encoded
+        assert json.loads(encoded) == {"id": 3, "success": True, "result": {"objects": [{"name": "Cube"}]}}
+        assert not addon_module._should_stream({"id": 3, "success": True, "result": raw})
+
+    def test_raw_json_result_inside_batch_is_decoded(self, handler):
+        result = handler.handle("batch", {"commands": [{"command": "scene.get_info", "params": {}}]})
+
+        assert result["results"][0]["success"] is True
+        assert result["results"][0]["result"]["name"] == "Scene"
+
+
 class TestPythonExecute:
     """Tests for the python.execute command handler."""
 
@@ -459,6 +1059,47 @@ class TestPythonSandbox:
         assert addon_module.APPROVED_SCRIPT_ROOTS == ["/tmp/a", "/tmp/b"]
         assert addon_module.ALLOWED_PATHS == ["/tmp/a", "/tmp/b"]
 
+    def test_safe_mode_filepath_validation(self, handler, addon_module, mock_bpy):
+        prefs = MagicMock()
+        prefs.safe_mode = True
+        prefs.port = 9876
+        prefs.allow_inline_code = True
+        prefs.approved_script_roots = "/tmp/allowed"
+        mock_bpy.context.preferences.addons["addon"] = MagicMock(preferences=prefs)
+
+        handler.handle("export.obj", {"filepath": "/tmp/allowed/scene.obj"})
+        with pytest.raises(PermissionError, match="outside allowed directories"):
+            handler.handle("export.obj", {"filepath": "/etc/scene.obj"})
+
+    def test_safe_mode_off_allows_any_path(self, handler, addon_module):
+        handler.handle("scene.get_info", {})
+        assert addon_module._validate_filepath("/etc/passwd") == "/etc/passwd"
+
+    def test_safe_mode_defaults_to_blend_directory(self, addon_module, mock_bpy):
+        addon_module.SAFE_MODE = True
+        assert addon_module._validate_filepath("/tmp/out.png") == "/tmp/out.png"
+        with pytest.raises(PermissionError):
+            addon_module._validate_filepath("/var/out.png")
+
+        mock_bpy.data.filepath = "/var/saved_as.blend"
+        assert addon_module._validate_filepath("/var/out.png") == "/var/out.png"
+
+    def test_allowed_prefixes_rebuilt_only_when_preferences_change(self, handler, addon_module, mock_bpy):
+        prefs = MagicMock(safe_mode=True, port=9876, allow_inline_code=True, approved_script_roots="/tmp/allowed")
+        mock_bpy.context.preferences.addons["addon"] = MagicMock(preferences=prefs)
+
+        with patch.object(
+            addon_module, "_refresh_allowed_prefixes", wraps=addon_module._refresh_allowed_prefixes
+        ) as refresh:
+            for _ in range(3):
+                handler.handle("scene.get_info", {})
+            assert refresh.call_count == 1
+            prefs.approved_script_roots = "/tmp/other"
+            handler.handle("scene.get_info", {})
+            assert refresh.call_count == 2
+
+        assert addon_module._ALLOWED_PREFIXES == ("/tmp/other",)
+
     def test_non_py_script_rejected(self, handler, addon_module):
         with tempfile.TemporaryDirectory() as tmpdir:
             script = os.path.join(tmpdir, "script.txt")
@@ -523,6 +1164,66 @@ class TestJobLifecycle:
         assert status["status"] == "running"
         assert status["cancellation_requested"] is True
 
+    def test_background_render_runs_as_process_job(self, handler, addon_module, mock_bpy):
+        mock_bpy.app.binary_path = "/opt/blender/blender"
+        process = MagicMock()
+        process.poll.return_value = None
+
+        with patch.object(addon_module.subprocess, "Popen", return_value=process) as popen:
+            result = handler.handle("render.still", {"output_path": "/tmp/out.png", "background": True})
+
+        mock_bpy.ops.render.render.assert_not_called()
+        argv = popen.call_args.args[0]
+        snapshot = argv[2]
+        assert argv[:2] == ["/opt/blender/blender", "--background"]
+        assert argv[3:] == ["--python-expr", addon_module._RENDER_STILL_EXPR]
+        assert result["status"] == "running"
+        assert result["output_path"] == "/tmp/out.png"
+        assert mock_bpy.app.timers.register.call_args.kwargs["persistent"] is True
+
+        job_id = result["job_id"]
+        assert addon_module._job_manager._poll_process_job(job_id) == addon_module.PROCESS_POLL_INTERVAL
+        process.poll.return_value = 0
+        assert addon_module._job_manager._poll_process_job(job_id) is None
+
+        status = handler.handle("job.status", {"job_id": job_id})
+        assert status["status"] == "succeeded"
+        assert status["result"] == {"returncode": 0}
+        assert not os.path.exists(snapshot)
+
+    def test_cancel_terminates_background_render(self, handler, addon_module, mock_bpy):
+        mock_bpy.app.binary_path = "/opt/blender/blender"
+        process = MagicMock()
+        process.poll.return_value = None
+        process.terminate.side_effect = lambda: setattr(process.poll, "return_value", -15)
+
+        with patch.object(addon_module.subprocess, "Popen", return_value=process):
+            job_id = handler.handle("render.animation", {"background": True})["job_id"]
+        handler.handle("job.cancel", {"job_id": job_id})
+
+        assert addon_module._job_manager._poll_process_job(job_id) is None
+        process.terminate.assert_called_once()
+        assert handler.handle("job.status", {"job_id": job_id})["status"] == "cancelled"
+
+    def test_background_render_removes_snapshot_when_save_fails(self, handler, mock_bpy):
+        mock_bpy.app.binary_path = "/opt/blender/blender"
+        saved = []
+
+        def fail_save(filepath, copy):
+            saved.append(filepath)
+            raise RuntimeError("disk full")
+
+        mock_bpy.ops.wm.save_as_mainfile.side_effect = fail_save
+        with pytest.raises(RuntimeError, match="disk full"):
+            handler.handle("render.still", {"background": True})
+
+        assert saved and not os.path.exists(saved[0])
+
+    def test_background_render_requires_blender_binary(self, handler, mock_bpy):
+        mock_bpy.app.binary_path = ""
+        with pytest.raises(RuntimeError, match="binary_path"):
+            handler.handle("render.still", {"background": True})
+
     def test_job_cancel_unknown_raises(self, handler):
         with pytest.raises(ValueError, match="Unknown job"):
             handler.handle("job.cancel", {"job_id": "job-nope"})
@@ -2,14 +2,19 @@
 
 import asyncio
 import json
+import socket
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.shared.memory import create_connected_server_and_client_session
 
 from blender_mcp_server.headless import HeadlessBlenderExecutor
 from blender_mcp_server.server import (
     HEADLESS_JOB_MANAGER,
+    MAX_FRAME_SIZE,
     BlenderConnection,
+    BlenderConnectionPool,
     job_cancel,
     job_list,
     job_status,
@@ -20,143 +25,452 @@ from blender_mcp_server.server import (
     render_still,
 )
 
+EXPECTED_TOOLS = (
+    "blender_scene_get_info",
+    "blender_scene_list_objects",
+    "blender_object_get_transform",
+    "blender_object_get_hierarchy",
+    "blender_object_create",
+    "blender_object_delete",
+    "blender_object_translate",
+    "blender_object_rotate",
+    "blender_object_scale",
+    "blender_object_bulk_transform",
+    "blender_object_duplicate",
+    "blender_material_list",
+    "blender_material_create",
+    "blender_material_assign",
+    "blender_material_set_color",
+    "blender_material_set_texture",
+    "blender_render_still",
+    "blender_render_animation",
+    "blender_export_gltf",
+    "blender_export_obj",
+    "blender_export_fbx",
+    "blender_history_undo",
+    "blender_history_redo",
+    "blender_batch",
+    "blender_python_exec",
+    "blender_python_exec_async",
+    "blender_job_status",
+    "blender_job_cancel",
+    "blender_job_list",
+)
+
 
 class TestToolRegistration:
     """Verify all expected tools are registered with correct metadata."""
 
-    def _get_tool_names(self):
-        return [t.name for t in mcp._tool_manager._tools.values()]
-
-    def test_scene_tools_registered(self):
-        names = self._get_tool_names()
-        assert "blender_scene_get_info" in names
-        assert "blender_scene_list_objects" in names
-
-    def test_object_read_tools_registered(self):
-        names = self._get_tool_names()
-        assert "blender_object_get_transform" in names
-        assert "blender_object_get_hierarchy" in names
-
-    def test_object_mutation_tools_registered(self):
-        names = self._get_tool_names()
-        for tool in [
-            "blender_object_create",
-            "blender_object_delete",
-            "blender_object_translate",
-            "blender_object_rotate",
-            "blender_object_scale",
-            "blender_object_duplicate",
-        ]:
-            assert tool in names
-
-    def test_material_tools_registered(self):
-        names = self._get_tool_names()
-        for tool in [
-            "blender_material_list",
-            "blender_material_create",
-            "blender_material_assign",
-            "blender_material_set_color",
-            "blender_material_set_texture",
-        ]:
-            assert tool in names
-
-    def test_render_tools_registered(self):
-        names = self._get_tool_names()
-        assert "blender_render_still" in names
-        assert "blender_render_animation" in names
-
-    def test_export_tools_registered(self):
-        names = self._get_tool_names()
-        for tool in [
-            "blender_export_gltf",
-            "blender_export_obj",
-            "blender_export_fbx",
-        ]:
-            assert tool in names
-
-    def test_history_tools_registered(self):
-        names = self._get_tool_names()
-        assert "blender_history_undo" in names
-        assert "blender_history_redo" in names
-
-    def test_python_exec_tools_registered(self):
-        names = self._get_tool_names()
-        assert "blender_python_exec" in names
-        assert "blender_python_exec_async" in names
-
-    def test_job_tools_registered(self):
-        names = self._get_tool_names()
-        assert "blender_job_status" in names
-        assert "blender_job_cancel" in names
-        assert "blender_job_list" in names
-
-    def test_total_tool_count(self):
-        assert len(self._get_tool_names()) == 27
+    @classmethod
+    def setup_class(cls):
+        # Registration happens at import time, so the tool set is fixed for the whole session
+        cls._tools = tuple(mcp._tool_manager._tools.values())
+        cls._names = frozenset(tool.name for tool in cls._tools)
+
+    @pytest.mark.parametrize("tool", EXPECTED_TOOLS)
+    def test_tool_registered(self, tool):
+        assert tool in self._names
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments_rejected_before_reaching_blender(self):
+        with (
+            patch.object(BlenderConnection, "send_command", AsyncMock()) as send_command,
+            pytest.raises(ToolError, match="validation error"),
+        ):
+            await mcp.call_tool("blender_object_translate", {"name": "Cube", "location": "up"})
+
+        send_command.assert_not_called()
+
+    def test_tool_set_exact(self):
+        # One comparison checks for missing and unexpected tools; pytest's set diff names them
+        assert self._names == frozenset(EXPECTED_TOOLS)
+        assert len(EXPECTED_TOOLS) == 29
 
     def test_all_tools_have_descriptions(self):
-        for tool in mcp._tool_manager._tools.values():
+        for tool in self._tools:
             assert tool.description, f"Tool {tool.name} has no description"
 
     def test_context_parameter_not_exposed_in_tool_schema(self):
-        for tool in mcp._tool_manager._tools.values():
+        for tool in self._tools:
             schema = getattr(tool, "inputSchema", None) or getattr(tool, "parameters", {})
             properties = schema.get("properties", {})
             assert "ctx" not in properties, f"Tool {tool.name} exposes ctx in schema"
 
 
+class FakeReader:
+    """Minimal StreamReader stand-in; readexactly() serves queued chunks and waits when none are queued."""
+
+    def __init__(self, *responses: dict):
+        self._chunks: asyncio.Queue[bytes | None] = asyncio.Queue()
+        for response in responses:
+            self.feed_frame(response)
+
+    def feed(self, chunk: bytes) -> None:
+        self._chunks.put_nowait(chunk)
+
+    def feed_frame(self, response: dict) -> None:
+        body = json.dumps(response).encode()
+        self.feed(len(body).to_bytes(4, "big"))
+        self.feed(body)
+
+    def feed_eof(self) -> None:
+        self._chunks.put_nowait(None)
+
+    async def readexactly(self, n: int) -> bytes:
+        chunk = await self._chunks.get()
+        if chunk is None:
+            raise asyncio.IncompleteReadError(b"", n)
+        return chunk
+
+
+class InstantWriter:
+    """Minimal StreamWriter stand-in; records each frame and hands its request to ``on_request``."""
+
+    def __init__(self, on_request=None, sock=None):
+        self.requests: list[dict] = []
+        self.frames: list[bytes] = []
+        self.closed = False
+        self._on_request = on_request
+        self._sock = sock
+
+    def writelines(self, buffers) -> None:
+        frame = b"".join(buffers)
+        self.frames.append(frame)
+        request = json.loads(frame[4:])
+        self.requests.append(request)
+        if self._on_request is not None:
+            self._on_request(request)
+
+    async def drain(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def wait_closed(self) -> None:
+        pass
+
+    def get_extra_info(self, name, default=None):
+        return self._sock if name == "socket" else default
+
+
 class TestBlenderConnection:
     """Test the TCP client that communicates with the Blender add-on."""
 
     @pytest.mark.asyncio
     async def test_send_command_success(self):
         conn = BlenderConnection()
-        response = {"id": "test-id", "success": True, "result": {"name": "Cube"}}
-
-        mock_reader = AsyncMock()
-        mock_reader.readline = AsyncMock(return_value=json.dumps(response).encode() + b"\n")
-        mock_writer = AsyncMock()
-        mock_writer.write = MagicMock()
-        mock_writer.drain = AsyncMock()
+        response = {"id": 1, "success": True, "result": {"name": "Cube"}}
 
-        conn._reader = mock_reader
-        conn._writer = mock_writer
+        writer = InstantWriter()
+        conn._reader = FakeReader(response)
+        conn._writer = writer
 
         result = await conn.send_command("scene.get_info")
         assert result == {"name": "Cube"}
+        await conn.disconnect()
+
+        sent = writer.frames[0]
+        assert int.from_bytes(sent[:4], "big") == len(sent) - 4
+        assert json.loads(sent[4:])["command"] == "scene.get_info"
 
     @pytest.mark.asyncio
     async def test_send_command_error_response(self):
         conn = BlenderConnection()
-        response = {"id": "test-id", "success": False, "error": "Object not found"}
-
-        mock_reader = AsyncMock()
-        mock_reader.readline = AsyncMock(return_value=json.dumps(response).encode() + b"\n")
-        mock_writer = AsyncMock()
-        mock_writer.write = MagicMock()
-        mock_writer.drain = AsyncMock()
+        response = {"id": 1, "success": False, "error": "Object not found"}
 
-        conn._reader = mock_reader
-        conn._writer = mock_writer
+        conn._reader = FakeReader(response)
+        conn._writer = InstantWriter()
 
         with pytest.raises(RuntimeError, match="Object not found"):
             await conn.send_command("object.get_transform", {"name": "Missing"})
+        await conn.disconnect()
 
     @pytest.mark.asyncio
     async def test_send_command_connection_closed(self):
         conn = BlenderConnection()
 
-        mock_reader = AsyncMock()
-        mock_reader.readline = AsyncMock(return_value=b"")
-        mock_writer = AsyncMock()
-        mock_writer.write = MagicMock()
-        mock_writer.drain = AsyncMock()
-
-        conn._reader = mock_reader
-        conn._writer = mock_writer
+        reader = FakeReader()
+        reader.feed_eof()
+        conn._reader = reader
+        conn._writer = InstantWriter()
 
         with pytest.raises(ConnectionError):
             await conn.send_command("scene.get_info")
 
+    @pytest.mark.asyncio
+    async def test_request_ids_increment_per_connection(self):
+        conn = BlenderConnection()
+        reader = FakeReader()
+        writer = InstantWriter(lambda request: reader.feed_frame({"id": request["id"], "success": True, "result": {}}))
+        conn._reader = reader
+        conn._writer = writer
+
+        await conn.send_command("scene.get_info")
+        await conn.send_command("object.get_transform", {"name": "Cube"})
+        await conn.disconnect()
+
+        sent = writer.requests
+        assert [r["id"] for r in sent] == [1, 2]
+        assert sent[0]["params"] == {}
+        assert sent[1] == {"id": 2, "command": "object.get_transform", "params": {"name": "Cube"}}
+
+    def test_request_frame_parses_back(self):
+        from blender_mcp_server.server import _encode_request
+
+        payload = _encode_request(7, 'object.rename"\n', {"name": "Cube", "offset": [0, 0.5]})
+        assert json.loads(payload) == {
+            "id": 7,
+            "command": 'object.rename"\n',
+            "params": {"name": "Cube", "offset": [0, 0.5]},
+        }
+        assert _encode_request(8, "scene.get_info", {}) == b'{"id":8,"command":"scene.get_info","params":{}}'
+
+    @pytest.mark.asyncio
+    async def test_zero_arg_template_reused(self):
+        from blender_mcp_server.server import _zero_arg_tail
+
+        conn = BlenderConnection()
+        reader = FakeReader()
+        writer = InstantWriter(lambda request: reader.feed_frame({"id": request["id"], "success": True, "result": {}}))
+        conn._reader = reader
+        conn._writer = writer
+
+        _zero_arg_tail.cache_clear()
+        await conn.send_command("history.undo")
+        await conn.send_command("history.undo", {})
+        await conn.disconnect()
+
+        assert _zero_arg_tail.cache_info().hits == 1
+        assert writer.requests == [
+            {"id": 1, "command": "history.undo", "params": {}},
+            {"id": 2, "command": "history.undo", "params": {}},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_commands_share_connection(self):
+        conn = BlenderConnection()
+        reader = FakeReader()
+        conn._reader = reader
+        conn._writer = InstantWriter()
+
+        first = asyncio.create_task(conn.send_command("scene.get_info"))
+        second = asyncio.create_task(conn.send_command("material.list"))
+        await asyncio.sleep(0)
+        assert set(conn._pending) == {1, 2}
+
+        # Answer out of order; each caller still gets its own result
+        reader.feed_frame({"id": 2, "success": True, "result": "second"})
+        reader.feed_frame({"id": 1, "success": True, "result": "first"})
+
+        assert await asyncio.gather(first, second) == ["first", "second"]
+        await conn.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_calls_connect_once(self):
+        connections = []
+
+        async def echo_frames(reader, writer):
+            connections.append(writer)
+            try:
+                while True:
+                    header = await reader.readexactly(4)
+                    request = json.loads(await reader.readexactly(int.from_bytes(header, "big")))
+                    body = json.dumps({"id": request["id"], "success": True, "result": request["command"]}).encode()
+                    writer.writelines((len(body).to_bytes(4, "big"), body))
+            except asyncio.IncompleteReadError:
+                writer.close()
+
+        server = await asyncio.start_server(echo_frames, "127.0.0.1", 0)
+        conn = BlenderConnection(port=server.sockets[0].getsockname()[1])
+        try:
+            results = await asyncio.wait_for(asyncio.gather(conn.send_command("a"), conn.send_command("b")), 5)
+        finally:
+            await conn.disconnect()
+            server.close()
+            for writer in connections:
+                writer.close()
+            await server.wait_closed()
+
+        assert results == ["a", "b"]
+        assert len(connections) == 1
+
+    @pytest.mark.asyncio
+    async def test_reader_restarts_for_new_stream(self):
+        conn = BlenderConnection()
+        old_task = MagicMock()
+        old_task.done.return_value = False
+        conn._reader_task = old_task
+        conn._reading = MagicMock()  # Bound to a stream that has since been replaced
+        conn._reader = FakeReader({"id": 1, "success": True, "result": "ok"})
+        conn._writer = InstantWriter()
+
+        assert await asyncio.wait_for(conn.send_command("scene.get_info"), 5) == "ok"
+        old_task.cancel.assert_called_once()
+        assert conn._reader_task is not old_task
+        await conn.disconnect()
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+    async def test_unix_transport_connects_to_socket_path(self, tmp_path):
+        path = str(tmp_path / "bridge.sock")
+
+        async def reply(reader, writer):
+            header = await reader.readexactly(4)
+            request = json.loads(await reader.readexactly(int.from_bytes(header, "big")))
+            body = json.dumps({"id": request["id"], "success": True, "result": "unix"}).encode()
+            writer.writelines((len(body).to_bytes(4, "big"), body))
+            await writer.drain()
+
+        server = await asyncio.start_unix_server(reply, path=path)
+        conn = BlenderConnection()
+        with patch.multiple("blender_mcp_server.server", BLENDER_TRANSPORT="unix", BLENDER_SOCKET_PATH=path):
+            try:
+                assert await asyncio.wait_for(conn.send_command("scene.get_info"), 5) == "unix"
+            finally:
+                await conn.disconnect()
+                server.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+    async def test_connect_unix_socket(self, tmp_path):
+        path = str(tmp_path / "explicit.sock")
+
+        async def reply(reader, writer):
+            header = await reader.readexactly(4)
+            request = json.loads(await reader.readexactly(int.from_bytes(header, "big")))
+            body = json.dumps({"id": request["id"], "success": True, "result": request["command"]}).encode()
+            writer.writelines((len(body).to_bytes(4, "big"), body))
+            await writer.drain()
+
+        server = await asyncio.start_unix_server(reply, path=path)
+        conn = BlenderConnection(path=path)
+        with patch("asyncio.open_connection", side_effect=AssertionError("TCP must not be used")):
+            try:
+                assert await asyncio.wait_for(conn.send_command("scene.get_info"), 5) == "scene.get_info"
+            finally:
+                await conn.disconnect()
+                server.close()
+
+    @pytest.mark.asyncio
+    async def test_send_many_pipelines(self):
+        conn = BlenderConnection()
+        reader = FakeReader()
+        writer = InstantWriter()
+        conn._reader = reader
+        conn._writer = writer
+
+        calls = [("object.delete", {"name": name}) for name in ("A", "B", "C")]
+        task = asyncio.create_task(conn.send_many(calls))
+        for _ in range(3):  # send_many, then the per-call tasks gather schedules
+            await asyncio.sleep(0)
+        # Every request is on the wire before the first reply arrives
+        assert [request["params"]["name"] for request in writer.requests] == ["A", "B", "C"]
+
+        for request in reversed(writer.requests):
+            reader.feed_frame({"id": request["id"], "success": True, "result": request["params"]["name"]})
+        assert await asyncio.wait_for(task, 5) == ["A", "B", "C"]
+        await conn.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_pool_round_robins(self):
+        writers = []
+
+        async def open_connection(host, port, **kwargs):
+            reader = FakeReader()
+            writers.append(
+                InstantWriter(lambda request: reader.feed_frame({"id": request["id"], "success": True, "result": None}))
+            )
+            return reader, writers[-1]
+
+        pool = BlenderConnectionPool(size=4)
+        with patch("asyncio.open_connection", side_effect=open_connection):
+            for _ in range(8):
+                await pool.send_command("scene.get_info")
+        await pool.disconnect()
+
+        assert len(writers) == 4
+        assert [len(writer.requests) for writer in writers] == [2, 2, 2, 2]
+        assert all(writer.closed for writer in writers)
+
+    @pytest.mark.asyncio
+    async def test_oversized_frame_drops_connection(self):
+        conn = BlenderConnection()
+        reader = FakeReader()
+        writer = InstantWriter(lambda request: reader.feed((MAX_FRAME_SIZE + 1).to_bytes(4, "big")))
+
+        with (
+            patch("asyncio.open_connection", AsyncMock(return_value=(reader, writer))) as open_connection,
+            pytest.raises(ConnectionError, match="exceeds"),
+        ):
+            await asyncio.wait_for(conn.send_command("scene.get_info"), 5)
+
+        assert open_connection.call_args.kwargs["limit"] == MAX_FRAME_SIZE
+        assert writer.closed
+        assert conn._writer is None
+
+    @pytest.mark.asyncio
+    async def test_send_batch_splits_into_batch_commands(self):
+        conn = BlenderConnection()
+        conn.max_batch = 2
+        sent = []
+
+        async def fake_send(command, params=None):
+            sent.append((command, params))
+            return {"results": [{"success": True, "result": item["command"]} for item in params["commands"]]}
+
+        with patch.object(conn, "send_command", side_effect=fake_send):
+            results = await conn.send_batch([("scene.get_info", None), ("material.list", {}), ("job.list", None)])
+
+        assert [r["result"] for r in results] == ["scene.get_info", "material.list", "job.list"]
+        assert [command for command, _ in sent] == ["batch", "batch"]
+        assert [len(params["commands"]) for _, params in sent] == [2, 1]
+        assert sent[0][1]["commands"][0] == {"command": "scene.get_info", "params": {}}
+
+    @pytest.mark.asyncio
+    async def test_iter_batch_yields_each_reply_as_it_arrives(self):
+        conn = BlenderConnection()
+        conn.max_batch = 1
+        replies = {"a": asyncio.get_running_loop().create_future(), "b": asyncio.get_running_loop().create_future()}
+
+        async def fake_send(command, params=None):
+            return await replies[params["commands"][0]["command"]]
+
+        with patch.object(conn, "send_command", side_effect=fake_send):
+            entries = conn.iter_batch([("a", None), ("b", None)])
+            replies["a"].set_result({"results": [{"success": True, "result": 1}]})
+            assert await asyncio.wait_for(entries.__anext__(), 1) == {"success": True, "result": 1}
+            assert not replies["b"].done()
+            replies["b"].set_result({"results": [{"success": True, "result": 2}]})
+            assert [entry async for entry in entries] == [{"success": True, "result": 2}]
+
+    @pytest.mark.asyncio
+    async def test_connect_sets_nodelay_and_keepalive(self):
+        conn = BlenderConnection()
+        sock = MagicMock()
+
+        with patch("asyncio.open_connection", AsyncMock(return_value=(FakeReader(), InstantWriter(sock=sock)))):
+            await conn.connect()
+        await conn.disconnect()
+
+        sock.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    @pytest.mark.asyncio
+    async def test_connection_reused_across_calls(self):
+        reader = FakeReader()
+        writer = InstantWriter(
+            lambda request: reader.feed_frame({"id": request["id"], "success": True, "result": request["id"]})
+        )
+        conn = BlenderConnection()
+
+        with patch("asyncio.open_connection", AsyncMock(return_value=(reader, writer))) as open_connection:
+            results = [await conn.send_command("scene.get_info") for _ in range(10)]
+        await conn.disconnect()
+
+        assert results == list(range(1, 11))
+        open_connection.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_connect_failure(self):
         conn = BlenderConnection(host="127.0.0.1", port=19999)
@@ -166,17 +480,31 @@ class TestBlenderConnection:
     @pytest.mark.asyncio
     async def test_auto_reconnect_on_first_call(self):
         conn = BlenderConnection()
-        response = {"id": "test-id", "success": True, "result": {}}
-
-        mock_reader = AsyncMock()
-        mock_reader.readline = AsyncMock(return_value=json.dumps(response).encode() + b"\n")
-        mock_writer = AsyncMock()
-        mock_writer.write = MagicMock()
-        mock_writer.drain = AsyncMock()
+        response = {"id": 1, "success": True, "result": {}}
 
-        with patch("asyncio.open_connection", return_value=(mock_reader, mock_writer)):
+        with patch("asyncio.open_connection", return_value=(FakeReader(response), InstantWriter())):
             result = await conn.send_command("scene.get_info")
             assert result == {}
+        await conn.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_lazy_connect_never_sleeps(self):
+        conn = BlenderConnection()
+        reader = FakeReader()
+        writer = InstantWriter(
+            lambda request: reader.feed_frame({"id": request["id"], "success": True, "result": "ok"})
+        )
+
+        # Callers wait on the connect lock and the reply future, never on a polling sleep
+        with (
+            patch("asyncio.open_connection", AsyncMock(return_value=(reader, writer))),
+            patch("asyncio.sleep", AsyncMock(side_effect=AssertionError("asyncio.sleep in send_command"))) as sleep,
+        ):
+            results = await asyncio.gather(*(conn.send_command("scene.get_info") for _ in range(3)))
+        await conn.disconnect()
+
+        assert results == ["ok"] * 3
+        sleep.assert_not_called()
 
 
 class TestHeadlessExecutor:
@@ -316,6 +644,39 @@ class TestHeadlessTransportTools:
         execute.assert_awaited_once()
         assert execute.await_args.kwargs["factory_startup"] is None
 
+    @pytest.mark.asyncio
+    async def test_tool_results_are_compact_json(self):
+        ctx = MagicMock()
+        ctx.request_context.lifespan_context.send_command = AsyncMock(return_value={"job_id": "job-1", "ok": [1, 2]})
+
+        result = await render_still(ctx, background=True)
+
+        assert result == '{"job_id":"job-1","ok":[1,2]}'
+
+    @pytest.mark.parametrize("fast", [True, False])
+    def test_wire_json_round_trips_with_and_without_orjson(self, fast):
+        from blender_mcp_server import server
+
+        message = {"id": 3, "command": "object.translate", "params": {"name": "Cube", "offset": [0, 0, 1.5]}}
+        with patch.object(server, "orjson", server.orjson if fast else None):
+            encoded = server._json_dumps(message)
+            assert isinstance(encoded, bytes)
+            assert b" " not in encoded
+            assert server._json_loads(encoded) == message
+            assert server._json_dumps({1: "a", "big": 2**70}) == b'{"1":"a","big":1180591620717411303424}'
+
+    @pytest.mark.asyncio
+    async def test_render_still_forwards_background_flag_to_bridge(self):
+        ctx = MagicMock()
+        ctx.request_context.lifespan_context.send_command = AsyncMock(return_value={"job_id": "job-1"})
+
+        result = await render_still(ctx, output_path="/tmp/test.png", background=True)
+
+        assert json.loads(result) == {"job_id": "job-1"}
+        ctx.request_context.lifespan_context.send_command.assert_awaited_once_with(
+            "render.still", {"output_path": "/tmp/test.png", "background": True}
+        )
+
     @pytest.mark.asyncio
     async def test_job_list_merges_headless_jobs(self):
         HEADLESS_JOB_MANAGER._jobs.clear()
@@ -362,3 +723,15 @@ class TestMCPProtocol:
         with patch.object(mcp, "run") as run:
             main()
         run.assert_called_once_with(transport="stdio")
+
+    @pytest.mark.asyncio
+    async def test_initialize_and_list_tools_in_process(self):
+        # Memory streams instead of a stdio subprocess: no interpreter start-up or re-import per run
+        with patch.object(BlenderConnection, "connect", AsyncMock(side_effect=OSError("Blender not running"))):
+            async with create_connected_server_and_client_session(mcp._mcp_server) as session:
+                initialized = await session.initialize()
+                listed = await session.list_tools()
+
+        assert initialized.serverInfo.name == "Blender MCP Server"
+        assert initialized.capabilities.tools is not None
+        assert len(listed.tools) == len(mcp._tool_manager._tools)